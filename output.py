@@ -1,23 +1,894 @@
 import math
 import csv
+import json
+import mmap
+import os
+import operator
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice, repeat, zip_longest
 
-def read_csv(path):
-    with open(path, newline='') as f:
-        reader = csv.reader(f)
-        rows = list(reader)
-    if not rows:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CSV_CHUNK_ROWS = 65536
+CSV_SAMPLE_ROWS = 1000
+# Cells treated as missing: numeric columns store them as NaN (so an int
+# column with gaps becomes float), string columns keep the raw text.
+MISSING_VALUES = frozenset(['', 'NA', 'N/A', 'NULL', 'null', 'None'])
+
+_COLUMN_KINDS = {'int': 'int', 'int64': 'int', 'float': 'float', 'float64': 'float',
+                 'string': 'string', 'str': 'string'}
+_WIDER_KIND = {'int': 'float', 'float': 'string'}
+
+def _infer_kind(cells):
+    present = [c for c in cells if c not in MISSING_VALUES]
+    if not present:
+        return 'string'
+    for kind, conv in (('int', int), ('float', float)):
+        try:
+            list(map(conv, present))
+        except ValueError:
+            continue
+        return kind
+    return 'string'
+
+def _parse_column(cells, kind):
+    if kind == 'string':
+        return cells
+    if not MISSING_VALUES.isdisjoint(cells):
+        kind = 'float'
+        cells = ['nan' if c in MISSING_VALUES else c for c in cells]
+    conv = int if kind == 'int' else float
+    try:
+        if np is not None:
+            return np.fromiter(map(conv, cells), np.int64 if kind == 'int' else np.float64, len(cells))
+        return array('q' if kind == 'int' else 'd', map(conv, cells))
+    except OverflowError:
+        raise ValueError(f"value out of range for a {kind} column")
+
+def _normalize_schema(schema, headers):
+    if len(schema) != len(headers):
+        raise ValueError(f"Schema has {len(schema)} types but the CSV has {len(headers)} columns")
+    kinds = []
+    for h, k in zip(headers, schema):
+        if k not in _COLUMN_KINDS:
+            raise ValueError(f"Unknown type '{k}' for column '{h}' (expected int, float or string)")
+        kinds.append(_COLUMN_KINDS[k])
+    return kinds
+
+def read_csv(path, schema=None):
+    reader = CSVChunks(path, CSV_CHUNK_ROWS, schema)
+    if reader.headers is None:
         return Table(rows=0, cols=0)
-    headers = rows[0]
-    data = []
-    for row in rows[1:]:
-        clean = []
-        for cell in row:
+    width = len(reader.headers)
+    parts = [[] for _ in range(width)]
+    rows = 0
+    for t in reader:
+        for part, col in zip(parts, t._columns()):
+            part.append(col)
+        rows += t.rows
+    if not rows:
+        return Table(rows=0, cols=width, headers=reader.headers)
+    # a column widened to string by a late chunk has earlier blocks parsed as
+    # numbers; those are read again as the original cell text
+    widened = [j for j, (kind, part) in enumerate(zip(reader.schema, parts))
+               if kind == 'string' and not all(_is_list_col(p) for p in part)]
+    for j, col in zip(widened, _csv_text_columns(path, widened)):
+        parts[j] = [col]
+    return Table._from_columns([_concat_all(p) for p in parts], reader.headers, rows)
+
+def _csv_text_columns(path, picked):
+    if not picked:
+        return []
+    cols = [[] for _ in picked]
+    try:
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                for col, j in zip(cols, picked):
+                    col.append(row[j] if j < len(row) else '')
+    except Exception as e:
+        raise IOError(f"Error reading CSV file at {path}: {e}")
+    return cols
+
+def read_csv_chunks(path, chunk=CSV_CHUNK_ROWS, schema=None):
+    return CSVChunks(path, chunk, schema)
+
+def read_csv_builtin(path, *opts):
+    # readCSV(path [, schema] [, chunk]) as exposed to WizuAll scripts
+    opts = list(opts)
+    schema = opts.pop(0) if opts and isinstance(opts[0], list) else None
+    if len(opts) > 1:
+        raise ValueError("readCSV expects readCSV(path [, schema] [, chunk])")
+    if opts:
+        return read_csv_chunks(path, opts[0], schema)
+    return read_csv(path, schema)
+
+class CSVChunks:
+    # Streams a CSV file as a sequence of Tables of at most `chunk` rows each.
+    # One chunk is read ahead so has_next() can answer without consuming.
+    # Column types come from `schema` or are inferred from the first `sample`
+    # rows; without an explicit schema a column that later fails to parse is
+    # widened (int -> float -> string) for the remaining chunks.
+    def __init__(self, path, chunk=CSV_CHUNK_ROWS, schema=None, sample=CSV_SAMPLE_ROWS):
+        if not isinstance(chunk, int) or chunk <= 0:
+            raise ValueError(f"CSV chunk size must be a positive integer, got {chunk}")
+        self.path = path
+        self.chunk = chunk
+        self.sample = sample
+        try:
+            self._file = open(path, newline='')
+            self._reader = csv.reader(self._file)
+            self.headers = next(self._reader, None)
+        except Exception as e:
+            raise IOError(f"Error reading CSV file at {path}: {e}")
+        self._fixed = schema is not None
+        self.schema = None
+        if self._fixed and self.headers is not None:
+            self.schema = _normalize_schema(schema, self.headers)
+        self._next = self._read() if self.headers is not None else None
+
+    def _read(self):
+        try:
+            rows = list(islice(self._reader, self.chunk))
+        except Exception as e:
+            self.close()
+            raise IOError(f"Error reading CSV file at {self.path}: {e}")
+        if not rows:
+            self.close()
+            return None
+        width = len(self.headers)
+        cols = [list(c) for c in zip_longest(*rows, fillvalue='')][:width]
+        cols += [[''] * len(rows) for _ in range(width - len(cols))]
+        if self.schema is None:
+            self.schema = [_infer_kind(c[:self.sample]) for c in cols]
+        return Table._from_columns([self._parse(j, c) for j, c in enumerate(cols)],
+                                   self.headers, len(rows))
+
+    def _parse(self, j, cells):
+        while True:
             try:
-                clean.append(float(cell) if '.' in cell else int(cell))
-            except Exception:
-                clean.append(cell)
-        data.append(clean)
-    return Table(rows=len(data), cols=len(headers), headers=headers, data=data)
+                return _parse_column(cells, self.schema[j])
+            except ValueError as e:
+                if self._fixed:
+                    raise ValueError(f"Column '{self.headers[j]}' does not match schema type "
+                                     f"'{self.schema[j]}': {e}")
+                self.schema[j] = _WIDER_KIND[self.schema[j]]
+
+    def has_next(self):
+        return self._next is not None
+
+    def next_chunk(self):
+        if self._next is None:
+            raise IndexError(f"No more chunks in {self.path}")
+        t, self._next = self._next, self._read()
+        return t
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._next is None:
+            raise StopIteration
+        return self.next_chunk()
+
+    def __str__(self):
+        return f"<CSV chunks of {self.chunk} rows from {self.path}>"
+
+    __repr__ = __str__
+
+# Binary table files: a fixed prefix (magic, format version, header length),
+# a JSON header with the row count, headers and per-column kind/offset/size,
+# then one 64-byte aligned block per column. int/float columns are raw
+# little-endian int64/float64; string columns are n+1 int64 offsets followed by
+# the UTF-8 bytes, and mixed columns store each cell as JSON the same way.
+# read_table maps the file copy-on-write, so numeric columns are numpy views
+# straight onto the page cache and rows are only built when asked for.
+TABLE_MAGIC = b'WZTB'
+TABLE_VERSION = 1
+_TABLE_PREFIX = struct.Struct('<4sIQ')
+_TABLE_ALIGN = 64
+
+def _aligned(n):
+    return -(-n // _TABLE_ALIGN) * _TABLE_ALIGN
+
+def _column_kind(col):
+    if not _is_list_col(col):
+        return 'float' if _is_float_col(col) else 'int'
+    return 'string' if all(isinstance(v, str) for v in col) else 'json'
+
+def _column_block(col, kind):
+    if kind in ('int', 'float'):
+        if np is not None and isinstance(col, np.ndarray):
+            return np.ascontiguousarray(col, dtype='<f8' if kind == 'float' else '<i8')
+        block = array('d' if kind == 'float' else 'q', col)
+        if sys.byteorder == 'big':
+            block.byteswap()
+        return block
+    encode = str.encode if kind == 'string' else (lambda v: json.dumps(v).encode())
+    parts = [encode(v) for v in col]
+    offsets = array('q', [0])
+    offsets.extend(accumulate(map(len, parts)))
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+    return offsets.tobytes() + b''.join(parts)
+
+def write_table(table, path):
+    cols = table._columns()
+    kinds = [_column_kind(c) for c in cols]
+    blocks = [_column_block(c, k) for c, k in zip(cols, kinds)]
+    meta, offset = [], 0
+    for kind, block in zip(kinds, blocks):
+        nbytes = memoryview(block).nbytes
+        meta.append({'kind': kind, 'offset': offset, 'nbytes': nbytes})
+        offset = _aligned(offset + nbytes)
+    header = json.dumps({'rows': table.rows, 'headers': list(table.headers), 'columns': meta}).encode()
+    start = _aligned(_TABLE_PREFIX.size + len(header))
+    # write beside the target and rename over it: the table being written
+    # may still be mapped from the old file, whose inode stays valid
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(_TABLE_PREFIX.pack(TABLE_MAGIC, TABLE_VERSION, len(header)))
+            f.write(header)
+            for m, block in zip(meta, blocks):
+                f.write(b'\0' * (start + m['offset'] - f.tell()))
+                f.write(block)
+        os.replace(tmp, path)
+    except OSError as e:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise IOError(f"Error writing table file at {path}: {e}")
+    return table
+
+def _read_column(buf, start, rows, m):
+    kind, off, nbytes = m['kind'], start + m['offset'], m['nbytes']
+    if kind in ('int', 'float'):
+        if np is not None:
+            return np.frombuffer(buf, dtype='<f8' if kind == 'float' else '<i8', count=rows, offset=off)
+        col = array('d' if kind == 'float' else 'q')
+        col.frombytes(memoryview(buf)[off:off + nbytes])
+        if sys.byteorder == 'big':
+            col.byteswap()
+        return col
+    offsets = array('q')
+    offsets.frombytes(memoryview(buf)[off:off + 8 * (rows + 1)])
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+    blob = buf[off + 8 * (rows + 1):off + nbytes]
+    text = blob.decode()
+    if len(text) != len(blob):
+        text = blob  # byte offsets only line up with str indices for ASCII
+    cells = [text[a:b] for a, b in zip(offsets, islice(offsets, 1, None))]
+    if text is blob:
+        cells = [c.decode() for c in cells]
+    return cells if kind == 'string' else _to_column(json.loads(c) for c in cells)
+
+def read_table(path):
+    try:
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError) as e:
+        raise IOError(f"Error reading table file at {path}: {e}")
+    if len(buf) < _TABLE_PREFIX.size:
+        raise ValueError(f"{path} is not a WizuAll table file")
+    magic, version, hlen = _TABLE_PREFIX.unpack_from(buf, 0)
+    if magic != TABLE_MAGIC:
+        raise ValueError(f"{path} is not a WizuAll table file")
+    if version != TABLE_VERSION:
+        raise ValueError(f"{path} uses table format version {version}, expected {TABLE_VERSION}")
+    header = json.loads(buf[_TABLE_PREFIX.size:_TABLE_PREFIX.size + hlen])
+    start = _aligned(_TABLE_PREFIX.size + hlen)
+    rows = header['rows']
+    cols = [_read_column(buf, start, rows, m) for m in header['columns']]
+    return Table._from_columns(cols, header['headers'], rows)
+
+# Column storage: numeric columns are contiguous typed arrays (numpy when it is
+# installed, the stdlib `array` module otherwise); anything holding strings or
+# other objects stays a plain Python list.
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+def _is_list_col(col):
+    return isinstance(col, list)
+
+def _is_float_col(col):
+    if np is not None and isinstance(col, np.ndarray):
+        return col.dtype.kind == 'f'
+    return isinstance(col, array) and col.typecode == 'd'
+
+def _to_column(values):
+    if np is not None and isinstance(values, np.ndarray):
+        return values
+    if isinstance(values, array):
+        return values
+    values = list(values)
+    # exact int/float cells are classified at C speed; anything else
+    # (subclasses, bools, strings) takes the per-cell check
+    kinds = set(map(type, values))
+    if kinds <= {int, float}:
+        kind = float if float in kinds else int
+    else:
+        kind = int
+        for v in values:
+            if not _is_number(v):
+                return values
+            if isinstance(v, float):
+                kind = float
+    try:
+        if np is not None:
+            return np.array(values, dtype=np.int64 if kind is int else np.float64)
+        return array('q' if kind is int else 'd', values)
+    except OverflowError:
+        return values
+
+def _zero_column(n):
+    if np is not None:
+        return np.zeros(n)
+    return array('d', [0.0]) * n
+
+def _cells(col):
+    return col if _is_list_col(col) else col.tolist()
+
+def _cell(col, i):
+    v = col[i]
+    return v.item() if np is not None and isinstance(v, np.generic) else v
+
+def _first_zero(columns):
+    hit = None
+    for j, col in enumerate(columns):
+        if np is not None and isinstance(col, np.ndarray):
+            idx = np.flatnonzero(col == 0)
+            i = int(idx[0]) if len(idx) else None
+        else:
+            i = next((r for r, v in enumerate(col) if v == 0), None)
+        if i is not None and (hit is None or i < hit[0]):
+            hit = (i, j)
+    return hit
+
+# int64 arithmetic in numpy wraps silently. The same result computed in
+# float64 cannot miss a value out of range, so int results are checked
+# against it and recomputed with Python ints when they may have wrapped.
+INT64_LIMIT = 2.0 ** 63
+
+def _may_wrap(approx):
+    return bool(np.any(np.abs(approx) >= INT64_LIMIT))
+
+def _col_sum(col):
+    if len(col) == 0:
+        return 0
+    if np is not None and isinstance(col, np.ndarray):
+        if col.dtype.kind == 'i' and _may_wrap(col.sum(dtype=np.float64)):
+            return sum(col.tolist())
+        return col.sum().item()
+    return sum(col)
+
+def _col_min(col):
+    if np is not None and isinstance(col, np.ndarray):
+        return col.min().item()
+    return min(col)
+
+def _col_max(col):
+    if np is not None and isinstance(col, np.ndarray):
+        return col.max().item()
+    return max(col)
+
+class ColumnView:
+    # Read-only window onto rows [start, stop) of a table column, returned by
+    # get_col and by slicing another view, so neither copies the cells. The
+    # table copies a column before update_cell writes to it while views or
+    # plans share it, so a view keeps the values it was taken from.
+    __slots__ = ('_col', '_start', '_stop')
+
+    def __init__(self, col, start=0, stop=None):
+        self._col = col
+        self._start = start
+        self._stop = len(col) if stop is None else stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            r = range(self._start, self._stop)[i]
+            if r.step == 1:
+                return ColumnView(self._col, r.start, r.start + len(r))
+            return [_cell(self._col, k) for k in r]
+        n = self._stop - self._start
+        if i < 0:
+            i += n
+        if not (0 <= i < n):
+            raise IndexError("list index out of range")
+        return _cell(self._col, self._start + i)
+
+    def tolist(self):
+        return list(_cells(self._col[self._start:self._stop]))
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __reversed__(self):
+        return reversed(self.tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self._col[self._start:self._stop], dtype=dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, SEQUENCE_TYPES):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.tolist())
+
+    __repr__ = __str__
+
+# what WizuAll treats as a list value
+SEQUENCE_TYPES = (list, ColumnView)
+
+STATS_BLOCK = 65536
+
+class ColumnStats:
+    # Running count/sum/mean/M2/min/max over one column. Values are folded in
+    # with Welford's update and partial results combine with Chan's formula,
+    # so a column is scanned once and nothing the size of the data is built.
+    __slots__ = ('count', 'total', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, x):
+        self.count += 1
+        self.total += x
+        d = x - self.mean
+        self.mean += d / self.count
+        self.m2 += d * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        return self
+
+    def remove(self, x):
+        # inverse of add() for count/sum/mean/M2; min and max cannot be undone
+        if self.count <= 1:
+            self.__init__()
+            return self
+        n = self.count - 1
+        d = x - self.mean
+        self.mean -= d / n
+        self.m2 = max(self.m2 - d * (x - self.mean), 0.0)
+        self.count = n
+        self.total -= x
+        return self
+
+    def merge(self, other):
+        if not other.count:
+            return self
+        n = self.count + other.count
+        d = other.mean - self.mean
+        self.m2 += other.m2 + d * d * self.count * other.count / n
+        self.mean += d * other.count / n
+        self.count = n
+        self.total += other.total
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        return self
+
+    @classmethod
+    def of(cls, values):
+        st = cls()
+        if np is not None and isinstance(values, np.ndarray):
+            # numpy reduces each cache-sized block; blocks merge as above
+            for i in range(0, len(values), STATS_BLOCK):
+                block = values[i:i + STATS_BLOCK]
+                part = cls()
+                part.count = len(block)
+                part.total = _col_sum(block)
+                part.mean = block.mean().item()
+                part.m2 = ((block - part.mean) ** 2).sum().item()
+                part.min = block.min().item()
+                part.max = block.max().item()
+                st.merge(part)
+            return st
+        for x in values:
+            st.add(x)
+        return st
+
+    def copy(self):
+        st = ColumnStats()
+        st.count, st.total, st.mean, st.m2, st.min, st.max = \
+            self.count, self.total, self.mean, self.m2, self.min, self.max
+        return st
+
+    def avg(self):
+        return self.total / self.count if self.count else None
+
+    def var(self, population=True):
+        n = self.count if population else self.count - 1
+        return self.m2 / n if n > 0 else None
+
+    def stdev(self, population=True):
+        v = self.var(population)
+        return math.sqrt(v) if v is not None else None
+
+def _var(values, population):
+    return ColumnStats.of(values).var(population)
+
+def merge_column_stats(parts):
+    # parts: per-chunk lists of ColumnStats (e.g. Table.column_stats() of
+    # each chunk); returns the per-column totals without touching the inputs
+    merged = None
+    for stats in parts:
+        if merged is None:
+            merged = [st.copy() for st in stats]
+        else:
+            for acc, st in zip(merged, stats):
+                acc.merge(st)
+    return merged or []
+
+MATMUL_BLOCK = 64
+
+def _matmul_blocked(a_rows, b_cols, block=MATMUL_BLOCK):
+    # Pure-Python kernel: b is consumed column-wise (its transpose), and a band
+    # of `block` columns is reused across every row of a before moving on.
+    out = [[] for _ in a_rows]
+    for jb in range(0, len(b_cols), block):
+        band = b_cols[jb:jb + block]
+        for row, acc in zip(a_rows, out):
+            acc.extend([sum(map(operator.mul, row, col), 0.0) for col in band])
+    return out
+
+def _matmul_blas(a_cols, b_cols):
+    a = np.column_stack(a_cols).astype(np.float64, copy=False)
+    b = np.column_stack(b_cols).astype(np.float64, copy=False)
+    return list(np.ascontiguousarray((a @ b).T))
+
+def matmul(a, b):
+    if a.cols != b.rows:
+        raise ValueError(f"Cannot matrix-multiply {a.rows}x{a.cols} by {b.rows}x{b.cols}")
+    a_cols, b_cols = a._columns(), b._columns()
+    numeric = not any(_is_list_col(c) for c in a_cols + b_cols)
+    if np is not None and numeric and a_cols and b_cols and a.rows:
+        return Table._from_columns(_matmul_blas(a_cols, b_cols), b.headers, a.rows)
+    par = _par_matmul(a, b)
+    if par is not None:
+        return par
+    out = _matmul_blocked(a._row_lists(), [_cells(c) for c in b_cols])
+    cols = [_to_column(c) for c in zip(*out)] if out else [_zero_column(0) for _ in b_cols]
+    return Table._from_columns(cols, b.headers, a.rows)
+
+def _concat_all(parts):
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return _zero_column(0)
+    if len(parts) == 1:
+        return parts[0]
+    if any(_is_list_col(p) for p in parts):
+        return _to_column([v for p in parts for v in _cells(p)])
+    if np is not None:
+        return np.concatenate(parts)
+    if len({p.typecode for p in parts}) > 1:
+        parts = [array('d', p) for p in parts]
+    out = array(parts[0].typecode)
+    for p in parts:
+        out.extend(p)
+    return out
+
+def _scatter(col, idx, vals, copy):
+    # col[idx] = vals, widening the column type the way update_cell does
+    if not _is_list_col(col) and all(_is_number(v) for v in vals) \
+            and (_is_float_col(col) or all(isinstance(v, int) for v in vals)):
+        out = (col.copy() if np is not None and isinstance(col, np.ndarray) else col[:]) if copy else col
+        try:
+            if np is not None and isinstance(out, np.ndarray):
+                out[idx] = vals
+            else:
+                for i, v in zip(idx, vals):
+                    out[i] = v
+            return out
+        except OverflowError:
+            pass
+    cells = col if _is_list_col(col) and not copy else list(_cells(col))
+    for i, v in zip(idx, vals):
+        cells[i] = v
+    return _to_column(cells)
+
+def _rows_to_columns(rows, width):
+    cols = list(zip_longest(*rows))[:width]
+    cols += [[None] * len(rows)] * (width - len(cols))
+    return [_to_column(c) for c in cols]
+
+# Lazy plans: slice_rows, select_cols and element-wise operators return a
+# Table holding one expression per column instead of data. Leaves are
+# ('col', column, start, stop) row ranges of an existing column, scalars are
+# ('num', value) and ('op', fn, left, right) applies an operator. Slices and
+# projections are pushed down to the leaves, so only the selected cells are
+# ever read, and the plan runs in one fused pass the first time the table's
+# columns are needed (printing, aggregates, plotting, indexing). Plans are
+# evaluated as trees, so an operand shared by both sides (t + t) is counted
+# twice; past LAZY_MAX_OPS operators the operand is materialised first.
+LAZY_MAX_OPS = 32
+
+def _plan_slice(expr, start, stop):
+    if expr[0] == 'col':
+        return ('col', expr[1], expr[2] + start, expr[2] + stop)
+    if expr[0] == 'op':
+        return ('op', expr[1], _plan_slice(expr[2], start, stop), _plan_slice(expr[3], start, stop))
+    return expr
+
+def _plan_leaves(expr, out):
+    if expr[0] == 'col':
+        out.append(expr[1])
+    elif expr[0] == 'op':
+        _plan_leaves(expr[2], out)
+        _plan_leaves(expr[3], out)
+    return out
+
+def _plan_array(expr):
+    if expr[0] == 'col':
+        return expr[1][expr[2]:expr[3]]
+    if expr[0] == 'num':
+        return expr[1]
+    a, b = _plan_array(expr[2]), _plan_array(expr[3])
+    out = expr[1](a, b)
+    if out.dtype.kind == 'i':
+        with np.errstate(all='ignore'):
+            approx = expr[1](np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+        if _may_wrap(approx):
+            raise OverflowError("int64 overflow")
+    return out
+
+def _plan_iter(expr):
+    if expr[0] == 'col':
+        return iter(_cells(expr[1][expr[2]:expr[3]]))
+    if expr[0] == 'num':
+        return repeat(expr[1])
+    return map(expr[1], _plan_iter(expr[2]), _plan_iter(expr[3]))
+
+def _plan_column(expr):
+    if expr[0] == 'col':
+        return expr[1][expr[2]:expr[3]]
+    # numpy evaluates operator by operator over just the selected range;
+    # otherwise chained map()s stream each cell through the whole expression
+    if np is not None and not any(_is_list_col(c) for c in _plan_leaves(expr, [])):
+        try:
+            return _plan_array(expr)
+        except OverflowError:
+            # exact Python ints; _to_column keeps them as a list if needed
+            pass
+    return _to_column(_plan_iter(expr))
+
+# Parallel execution: tables with at least PARALLEL_MIN_CELLS cells are split
+# into row ranges handled by a process pool. Columns are copied once into a
+# shared-memory block that workers attach to by name and write results back
+# into, so only row bounds and small aggregate states cross the process
+# boundary. Needs the fork start method; elsewhere everything stays serial.
+# The workers are forked as soon as set_workers() asks for them, which
+# wizuall.py does before running a script, while the process is still
+# single-threaded: forking later, once chart render threads or BLAS threads
+# run, can deadlock the children. Without a set_workers() call the count is
+# read from WIZUALL_WORKERS on the first table big enough to split.
+PARALLEL_MIN_CELLS = 1 << 20
+_workers = None
+_min_cells = PARALLEL_MIN_CELLS
+_pool = None
+
+def set_workers(n, min_cells=None):
+    global _workers, _min_cells, _pool
+    _workers = max(int(n or 1), 1)
+    if min_cells is not None:
+        _min_cells = min_cells
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+    if _workers >= 2 and hasattr(os, 'fork'):
+        _par_pool()
+
+def _par_init():
+    # workers run their partition serially
+    global _workers, _pool
+    _workers, _pool = 1, None
+
+def _par_pool():
+    global _pool
+    if _pool is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import resource_tracker
+        # workers must share the parent's tracker for the shared-memory blocks
+        resource_tracker.ensure_running()
+        _pool = ProcessPoolExecutor(_workers, mp_context=multiprocessing.get_context('fork'),
+                                    initializer=_par_init)
+        # with fork, the first submit starts every worker at once
+        _pool.submit(int).result()
+    return _pool
+
+def _par_wanted(cells):
+    if cells < _min_cells or not hasattr(os, 'fork'):
+        return False
+    if _workers is None:
+        set_workers(os.environ.get('WIZUALL_WORKERS'))
+    return _workers >= 2
+
+def _par_ok(cells, columns):
+    return _par_wanted(cells) and not any(_is_list_col(c) for c in columns)
+
+def _typecode(col):
+    if np is not None and isinstance(col, np.ndarray):
+        return 'd' if col.dtype.kind == 'f' else 'q'
+    return col.typecode
+
+def _shm_view(buf, spec):
+    off, tc, n = spec
+    if np is not None:
+        return np.ndarray(n, dtype=np.float64 if tc == 'd' else np.int64, buffer=buf, offset=off)
+    return buf[off:off + 8 * n].cast(tc)
+
+def _par_store(view, lo, hi, values):
+    if np is not None:
+        view[lo:hi] = values
+    else:
+        view[lo:hi] = values if isinstance(values, array) and values.typecode == view.format \
+            else array(view.format, values)
+
+def _par_worker(task, name, specs, lo, hi, arg):
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        views = [_shm_view(shm.buf, spec) for spec in specs]
+        try:
+            return _par_task(task, views, lo, hi, arg)
+        except (OverflowError, TypeError, ValueError):
+            return False
+        finally:
+            del views
+    finally:
+        shm.close()
+
+def _par_task(task, views, lo, hi, arg):
+    n = arg[0]
+    part = Table._from_columns([v[lo:hi] for v in views[:n]], None, hi - lo)
+    if task == 'stats':
+        return part.column_stats()
+    if task == 'rows':
+        _par_store(views[n], lo, hi, getattr(part, arg[1])(**arg[2]))
+        return True
+    if task == 'binop':
+        fn, reverse, other = arg[1:]
+        if other is None:
+            other = Table._from_columns([v[lo:hi] for v in views[n:2 * n]], None, hi - lo)
+        res = part._elementwise(other, fn, reverse)._columns()
+        if any(_is_list_col(c) for c in res):
+            return False
+        for out, col in zip(views[-n:], res):
+            _par_store(out, lo, hi, col)
+        return True
+    if task == 'matmul':
+        b_cols = [_cells(v) for v in views[n:n + arg[1]]]
+        out = _matmul_blocked(part._row_lists(), b_cols)
+        for j, view in enumerate(views[n + arg[1]:]):
+            _par_store(view, lo, hi, [r[j] for r in out])
+        return True
+    raise ValueError(f"Unknown parallel task '{task}'")
+
+def _par_run(task, inputs, outputs, rows, arg):
+    # Returns (per-partition results, output columns), or None when a worker
+    # could not produce typed output and the caller should run serially.
+    from multiprocessing import shared_memory
+    specs, off = [], 0
+    for tc, n in [(_typecode(c), len(c)) for c in inputs] + list(outputs):
+        specs.append((off, tc, n))
+        off += 8 * n
+    shm = shared_memory.SharedMemory(create=True, size=max(off, 8))
+    try:
+        for spec, col in zip(specs, inputs):
+            _par_store(_shm_view(shm.buf, spec), 0, spec[2], col)
+        step = -(-rows // _workers)
+        futures = [_par_pool().submit(_par_worker, task, shm.name, specs, lo, min(lo + step, rows), arg)
+                   for lo in range(0, rows, step)]
+        results = [f.result() for f in futures]
+        if any(r is False for r in results):
+            return None
+        outs = []
+        for spec in specs[len(inputs):]:
+            view = _shm_view(shm.buf, spec)
+            outs.append(view.copy() if np is not None else array(spec[1], view))
+            del view
+        return results, outs
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            pass
+        shm.unlink()
+
+def _par_column_stats(table):
+    cols = table._columns()
+    res = _par_run('stats', cols, [], table.rows, (len(cols),))
+    return merge_column_stats(res[0]) if res else None
+
+def _par_rows(table, method, **kwargs):
+    cols = table._columns()
+    if not _par_ok(table.rows * table.cols, cols):
+        return None
+    tc = 'd' if method in ('avg_rows', 'var_rows') or any(_typecode(c) == 'd' for c in cols) else 'q'
+    res = _par_run('rows', cols, [(tc, table.rows)], table.rows, (len(cols), method, kwargs))
+    return _cells(res[1][0]) if res else None
+
+def _par_elementwise(table, other, fn, reverse):
+    # checked before _columns() so that, when the pool is not used, pending
+    # plans of the operands stay lazy and chained operators fuse
+    if table.rows < 2 or not _par_wanted(table.rows * table.cols):
+        return None
+    cols = table._columns()
+    others = other._columns() if isinstance(other, Table) else []
+    if not _par_ok(table.rows * table.cols, cols + others):
+        return None
+    # the result type of each column comes from running the op on row 0
+    probe = Table._from_columns([c[:1] for c in cols], None, 1)._elementwise(
+        Table._from_columns([c[:1] for c in others], None, 1) if others else other, fn, reverse)
+    probe_cols = probe._columns()
+    if any(_is_list_col(c) for c in probe_cols):
+        return None
+    outs = [(_typecode(c), table.rows) for c in probe_cols]
+    res = _par_run('binop', cols + others, outs, table.rows,
+                   (len(cols), fn, reverse, None if others else other))
+    return Table._from_columns(res[1], table.headers, table.rows) if res else None
+
+def _par_matmul(a, b):
+    a_cols, b_cols = a._columns(), b._columns()
+    if not _par_ok(a.rows * b.cols * a.cols, a_cols + b_cols) or not a.rows:
+        return None
+    res = _par_run('matmul', a_cols + b_cols, [('d', a.rows)] * b.cols, a.rows,
+                   (len(a_cols), len(b_cols)))
+    return Table._from_columns(res[1], b.headers, a.rows) if res else None
+
+class _RowsView:
+    # Row-major compatibility view over a Table's columns, so that code still
+    # written against `table.data[i]` / `for row in table.data` keeps working.
+    def __init__(self, table):
+        self._table = table
+
+    def __len__(self):
+        return self._table.rows
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._table.get_row(r) for r in range(*i.indices(self._table.rows))]
+        return self._table.get_row(i)
+
+    def __iter__(self):
+        return iter(self._table._row_lists())
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __str__(self):
+        return str(self._table._row_lists())
+
+    __repr__ = __str__
 
 class Table:
     def __init__(self, rows: int, cols: int, headers=None, data=None):
@@ -27,303 +898,542 @@ class Table:
             self.headers = [str(i) for i in range(cols)]
         else:
             self.headers = headers
-        if data:
-            self.data = data
+        self._tail = []
+        self._chunks = []
+        self._stats = None
+        self._plan = None
+        self._ops = 0
+        self._shared = set()
+        if data is not None and len(data) > 0:
+            self._cols = _rows_to_columns(data, self.cols)
         else:
-            self.data = [[0.0 for _ in range(cols)] for _ in range(rows)]
+            self._cols = [_zero_column(rows) for _ in range(cols)]
+
+    @classmethod
+    def _from_columns(cls, columns, headers, rows=None):
+        t = cls.__new__(cls)
+        t._cols = list(columns)
+        t._tail = []
+        t._chunks = []
+        t._stats = None
+        t._plan = None
+        t._ops = 0
+        t._shared = set()
+        t.cols = len(t._cols)
+        t.rows = rows if rows is not None else (len(t._cols[0]) if t._cols else 0)
+        t.headers = headers
+        return t
+
+    @classmethod
+    def _from_plan(cls, plan, headers, rows, ops=0):
+        t = cls._from_columns([], headers, rows)
+        t._plan = plan
+        t._ops = ops
+        t.cols = len(plan)
+        return t
+
+    def _columns(self):
+        if self._plan is not None:
+            self._cols = [_plan_column(e) for e in self._plan]
+            # bare row ranges may be numpy views onto another table's columns
+            self._shared = {j for j, e in enumerate(self._plan) if e[0] == 'col'}
+            self._plan = None
+            self._ops = 0
+        # Rows added by append_row/append_rows are buffered as column chunks
+        # and folded in on the next columnar read, each column allocated once
+        # at its final size, so appends stay O(1) per row.
+        self._flush_tail()
+        if self._chunks:
+            chunks, self._chunks = self._chunks, []
+            self._cols = [_concat_all([c] + [ch[j] for ch in chunks]) for j, c in enumerate(self._cols)]
+            self._shared = set()
+        return self._cols
+
+    def _flush_tail(self):
+        if self._tail:
+            self._chunks.append([_to_column(c) for c in zip(*self._tail)])
+            self._tail = []
+
+    def _lazy(self):
+        # this table as a plan; its columns become shared with the new plan,
+        # so an in-place update_cell copies them first (copy-on-write)
+        if self._plan is not None and self._ops < LAZY_MAX_OPS:
+            return self._plan
+        cols = self._columns()
+        self._shared = set(range(len(cols)))
+        return [('col', c, 0, self.rows) for c in cols]
+
+    def _row_lists(self):
+        cols = self._columns()
+        if not cols:
+            return [[] for _ in range(self.rows)]
+        return [list(r) for r in zip(*(_cells(c) for c in cols))]
+
+    @property
+    def data(self):
+        return _RowsView(self)
+
+    @data.setter
+    def data(self, rows):
+        rows = list(rows)
+        self.rows = len(rows)
+        self._tail = []
+        self._chunks = []
+        self._stats = None
+        self._plan = None
+        self._ops = 0
+        self._shared = set()
+        self._cols = _rows_to_columns(rows, self.cols) if rows else [_zero_column(0) for _ in range(self.cols)]
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @headers.setter
+    def headers(self, names):
+        self._headers = names
+        self._index = None
+
+    def col_index(self, name):
+        # header -> position map, built on first lookup; the first of any
+        # duplicate headers wins, as with list.index
+        if self._index is None:
+            self._index = {}
+            for j, h in enumerate(self._headers):
+                self._index.setdefault(h, j)
+        try:
+            return self._index[name]
+        except KeyError:
+            raise ValueError(f"No column named '{name}'") from None
+
+    def get_row(self, i: int):
+        if i < 0:
+            i += self.rows
+        if not (0 <= i < self.rows):
+            raise IndexError(f"Row {i} out of range")
+        if self._plan is not None:
+            return [_cell(_plan_column(_plan_slice(e, i, i + 1)), 0) for e in self._plan]
+        return [_cell(c, i) for c in self._columns()]
+
+    def get_col(self, j: int):
+        if j < 0:
+            j += self.cols
+        if self._plan is not None:
+            return ColumnView(_plan_column(self._plan[j]))
+        cols = self._columns()
+        self._shared.add(j)
+        return ColumnView(cols[j], 0, self.rows)
+
+    def get_col_by_name(self, name):
+        return self.get_col(self.col_index(name))
+
+    def col_range(self, first, last):
+        # columns from `first` through `last` inclusive, like a label slice
+        i, j = self.col_index(first), self.col_index(last)
+        return self.select_cols(self.headers[i:j + 1])
+
+    def slice_rows(self, start, end):
+        r = range(self.rows)[start:end]
+        plan = [_plan_slice(e, r.start, r.start + len(r)) for e in self._lazy()]
+        return Table._from_plan(plan, self.headers, len(r), self._ops)
+
+    def select_cols(self, names):
+        plan = self._lazy()
+        picked = [plan[self.col_index(name)] for name in names]
+        return Table._from_plan(picked, list(names), self.rows, self._ops)
 
     def append_row(self, values: list):
         if len(values) != self.cols:
             raise ValueError(f"Cannot append row: expected {self.cols} values, got {len(values)}")
-        self.data.append(values)
+        if self._plan is not None:
+            # plans cover the first self.rows rows only; run it before the
+            # table grows
+            self._columns()
+        self._tail.append(list(values))
         self.rows += 1
+        stats = self._stats
+        if stats is not None:
+            for j, v in enumerate(values):
+                if stats[j] is not None:
+                    if _is_number(v):
+                        stats[j].add(v)
+                    else:
+                        stats[j] = None
+        return self
+
+    def append_rows(self, rows):
+        rows = list(rows)
+        bad = next((r for r in rows if len(r) != self.cols), None)
+        if bad is not None:
+            raise ValueError(f"Cannot append rows: expected {self.cols} values per row, got {len(bad)}")
+        if not rows:
+            return self
+        # shapes are checked once above, so the rows transpose straight into
+        # one column chunk per call
+        if self._plan is not None:
+            self._columns()
+        self._flush_tail()
+        chunk = [_to_column(c) for c in zip(*rows)]
+        self._chunks.append(chunk)
+        self.rows += len(rows)
+        stats = self._stats
+        if stats is not None:
+            for j, col in enumerate(chunk):
+                if stats[j] is not None:
+                    numeric = not _is_list_col(col) or all(_is_number(v) for v in col)
+                    stats[j] = stats[j].merge(ColumnStats.of(col)) if numeric else None
+        return self
+
+    def _col_pos(self, col):
+        j = self.col_index(col) if isinstance(col, str) else col
+        if not (isinstance(j, int) and 0 <= j < self.cols):
+            raise IndexError(f"Column {col} out of range")
+        return j
+
+    def update_cells(self, rows, cols, values):
+        # rows/cols/values are parallel lists; a single column index or name
+        # applies to every row
+        rows, values = list(rows), list(values)
+        cols = list(cols) if isinstance(cols, SEQUENCE_TYPES) else [cols] * len(rows)
+        if not (len(rows) == len(cols) == len(values)):
+            raise ValueError(f"Cannot update cells: got {len(rows)} rows, {len(cols)} columns "
+                             f"and {len(values)} values")
+        by_col = {}
+        for r, c, v in zip(rows, cols, values):
+            if not (isinstance(r, int) and 0 <= r < self.rows):
+                raise IndexError(f"Cannot update cell: row {r} out of range")
+            idx, vals = by_col.setdefault(self._col_pos(c), ([], []))
+            idx.append(r)
+            vals.append(v)
+        table_cols = self._columns()
+        for j, (idx, vals) in by_col.items():
+            table_cols[j] = _scatter(table_cols[j], idx, vals, j in self._shared)
+            self._shared.discard(j)
+            if self._stats is not None:
+                self._stats[j] = None
+        return self
+
+    def fill_col(self, col, values):
+        j = self._col_pos(col)
+        if isinstance(values, SEQUENCE_TYPES):
+            if len(values) != self.rows:
+                raise ValueError(f"Cannot fill column: expected {self.rows} values, got {len(values)}")
+            column = _to_column(values)
+        else:
+            column = _to_column([values] * self.rows)
+        self._columns()[j] = column
+        self._shared.discard(j)
+        if self._stats is not None:
+            self._stats[j] = None
         return self
 
-    def update_cell(self, row: int, col: int, value):
+    def update_cell(self, row: int, col, value):
+        if isinstance(col, str):
+            col = self.col_index(col)
         if not (0 <= row < self.rows) or not (0 <= col < self.cols):
             raise IndexError(f"Cannot update cell: row {row} or col {col} out of range")
-        self.data[row][col] = value
+        cols = self._columns()
+        column = cols[col]
+        if col in self._shared:
+            column = cols[col] = column.copy() if np is not None and isinstance(column, np.ndarray) else column[:]
+            self._shared.discard(col)
+        self._update_stats(col, _cell(column, row), value)
+        if _is_list_col(column) or (_is_number(value) and (isinstance(value, int) or _is_float_col(column))):
+            try:
+                column[row] = value
+                return self
+            except OverflowError:
+                pass
+        cells = _cells(column)
+        cells[row] = value
+        cols[col] = _to_column(cells)
         return self
 
+    def _update_stats(self, j, old, new):
+        st = self._stats[j] if self._stats is not None else None
+        if st is None:
+            return
+        # a cell that held the column's min or max can only be swapped in
+        # place when the new value keeps that extreme; otherwise rescan later
+        if _is_number(new) and (old > st.min or new <= old) and (old < st.max or new >= old):
+            st.remove(old).add(new)
+        else:
+            self._stats[j] = None
+
+    def _col_stats(self, j):
+        # Per-column aggregates are computed on first use and then kept
+        # current by append_row/update_cell; None means non-numeric.
+        if self._stats is None:
+            self._stats = [None] * self.cols
+        st = self._stats[j]
+        if st is None:
+            col = self._columns()[j]
+            if _is_list_col(col) and not all(_is_number(v) for v in col):
+                return None
+            st = self._stats[j] = ColumnStats.of(col)
+        return st
+
+    def _agg_cols(self, read, fallback):
+        if self._stats is None and _par_ok(self.rows * self.cols, self._columns()):
+            self._stats = _par_column_stats(self)
+        out = []
+        for j in range(self.cols):
+            st = self._col_stats(j)
+            out.append(read(st) if st is not None else fallback(self._columns()[j]))
+        return out
+
     def _check_shape(self, other):
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError(f"Shape mismatch: {self.rows}x{self.cols} vs {other.rows}x{other.cols}")
 
-    def __add__(self, other):
+    def _elementwise(self, other, fn, reverse=False):
         if isinstance(other, Table):
             self._check_shape(other)
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] + other.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] + other for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        return NotImplemented
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        par = _par_elementwise(self, other, fn, reverse)
+        if par is not None:
+            return par
+        lhs = self._lazy()
+        if isinstance(other, Table):
+            rhs = other._lazy()
+            ops = self._ops + other._ops
+        else:
+            rhs = [('num', other)] * self.cols
+            ops = self._ops
+        if reverse:
+            plan = [('op', fn, b, a) for a, b in zip(lhs, rhs)]
+        else:
+            plan = [('op', fn, a, b) for a, b in zip(lhs, rhs)]
+        return Table._from_plan(plan, self.headers, self.rows, ops + 1)
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
 
     __radd__ = __add__
 
     def __sub__(self, other):
-        if isinstance(other, Table):
-            self._check_shape(other)
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] - other.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] - other for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        return NotImplemented
+        return self._elementwise(other, operator.sub)
 
     def __rsub__(self, other):
         if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[other - self.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
+            return self._elementwise(other, operator.sub, reverse=True)
         return NotImplemented
 
     def __mul__(self, other):
-        if isinstance(other, Table):
-            self._check_shape(other)
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] * other.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] * other for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        return NotImplemented
+        return self._elementwise(other, operator.mul)
 
     __rmul__ = __mul__
 
     def __truediv__(self, other):
         if isinstance(other, Table):
             self._check_shape(other)
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] / other.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] / other for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        return NotImplemented
+            hit = _first_zero(other._columns())
+            if hit:
+                raise ZeroDivisionError(f"Division by zero at cell [{hit[0]}][{hit[1]}]")
+        elif isinstance(other, (int, float)) and other == 0:
+            raise ZeroDivisionError("Division by zero for scalar division.")
+        return self._elementwise(other, operator.truediv)
 
     def __rtruediv__(self, other):
         if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[other / self.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
+            hit = _first_zero(self._columns())
+            if hit:
+                raise ZeroDivisionError(f"Division by zero at cell [{hit[0]}][{hit[1]}] in reverse division.")
+            return self._elementwise(other, operator.truediv, reverse=True)
         return NotImplemented
 
     def __mod__(self, other):
         if isinstance(other, Table):
             self._check_shape(other)
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] % other.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[self.data[i][j] % other for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
-        return NotImplemented
+            hit = _first_zero(other._columns())
+            if hit:
+                raise ZeroDivisionError(f"Modulo by zero at cell [{hit[0]}][{hit[1]}]")
+        elif isinstance(other, (int, float)) and other == 0:
+            raise ZeroDivisionError("Modulo by zero for scalar modulo.")
+        return self._elementwise(other, operator.mod)
 
     def __rmod__(self, other):
         if isinstance(other, (int, float)):
-            t = Table(self.rows, self.cols, self.headers)
-            t.data = [[other % self.data[i][j] for j in range(self.cols)]
-                      for i in range(self.rows)]
-            return t
+            hit = _first_zero(self._columns())
+            if hit:
+                raise ZeroDivisionError(f"Modulo by zero at cell [{hit[0]}][{hit[1]}] in reverse modulo.")
+            return self._elementwise(other, operator.mod, reverse=True)
         return NotImplemented
 
     def __matmul__(self, other):
         if not isinstance(other, Table):
             return NotImplemented
-        if self.cols != other.rows:
-            raise ValueError(f"Cannot matrix-multiply {self.rows}x{self.cols} by {other.rows}x{other.cols}")
-        t = Table(self.rows, other.cols, other.headers)
-        for i in range(self.rows):
-            for j in range(other.cols):
-                acc = 0.0
-                for k in range(self.cols):
-                    acc += self.data[i][k] * other.data[k][j]
-                t.data[i][j] = acc
-        return t
+        return matmul(self, other)
+
+    def _numeric_stack(self):
+        # (rows x cols) float/int matrix for row-wise reductions, or None when
+        # numpy is missing or a column holds non-numeric cells.
+        cols = self._columns()
+        if np is None or not cols or any(_is_list_col(c) for c in cols):
+            return None
+        return np.column_stack(cols)
 
     def flatten(self):
-        return [cell for row in self.data for cell in row]
+        return [cell for row in self._row_lists() for cell in row]
 
     def sum_table(self):
-        return sum(self.flatten())
+        return sum(self.sum_cols())
 
     def sum_rows(self):
-        return [sum(r) for r in self.data]
+        par = _par_rows(self, 'sum_rows')
+        if par is not None:
+            return par
+        m = self._numeric_stack()
+        if m is not None and not (m.dtype.kind == 'i' and _may_wrap(m.sum(axis=1, dtype=np.float64))):
+            return m.sum(axis=1).tolist()
+        return [sum(r) for r in self._row_lists()]
 
     def sum_cols(self):
-        return [sum(self.data[r][c] for r in range(self.rows)) for c in range(self.cols)]
+        return self._agg_cols(lambda st: st.total, _col_sum)
 
     def avg_table(self):
-        flat = self.flatten()
-        return sum(flat) / len(flat) if flat else None
+        n = self.rows * self.cols
+        return self.sum_table() / n if n else None
 
     def avg_rows(self):
-        return [sum(r) / len(r) if r else None for r in self.data]
+        par = _par_rows(self, 'avg_rows')
+        if par is not None:
+            return par
+        m = self._numeric_stack()
+        if m is not None:
+            return m.mean(axis=1).tolist()
+        return [sum(r) / len(r) if r else None for r in self._row_lists()]
 
     def avg_cols(self):
-        return [
-            sum(self.data[r][c] for r in range(self.rows)) / self.rows
-            if self.rows else None
-            for c in range(self.cols)
-        ]
+        return self._agg_cols(ColumnStats.avg, lambda c: _col_sum(c) / len(c) if len(c) else None)
+
+    def column_stats(self):
+        return self._agg_cols(ColumnStats.copy, ColumnStats.of)
 
     def var_table(self, population=True):
-        flat = self.flatten()
-        μ = sum(flat) / len(flat)
-        dd = [(x - μ) ** 2 for x in flat]
-        n = len(dd) if population else len(dd) - 1
-        return sum(dd) / n if n > 0 else None
+        total = ColumnStats()
+        for st in self.column_stats():
+            total.merge(st)
+        return total.var(population)
 
     def stdev_table(self, population=True):
         return math.sqrt(self.var_table(population))
 
     def var_rows(self, population=True):
-        out = []
-        for r in self.data:
-            μ = sum(r) / len(r)
-            dd = [(x - μ) ** 2 for x in r]
-            n = len(dd) if population else len(dd) - 1
-            out.append(sum(dd) / n if n > 0 else None)
-        return out
+        par = _par_rows(self, 'var_rows', population=population)
+        if par is not None:
+            return par
+        m = self._numeric_stack()
+        if m is not None:
+            n = self.cols if population else self.cols - 1
+            if n <= 0:
+                return [None] * self.rows
+            return m.var(axis=1, ddof=0 if population else 1).tolist()
+        return [_var(r, population) for r in self._row_lists()]
 
     def stdev_rows(self, population=True):
         return [math.sqrt(v) if v is not None else None for v in self.var_rows(population)]
 
     def var_cols(self, population=True):
-        out = []
-        for c in range(self.cols):
-            col = [self.data[r][c] for r in range(self.rows)]
-            μ = sum(col) / len(col)
-            dd = [(x - μ) ** 2 for x in col]
-            n = len(dd) if population else len(dd) - 1
-            out.append(sum(dd) / n if n > 0 else None)
-        return out
+        return self._agg_cols(lambda st: st.var(population), lambda c: _var(c, population))
 
     def stdev_cols(self, population=True):
         return [math.sqrt(v) if v is not None else None for v in self.var_cols(population)]
 
+    def describe(self, population=True):
+        # One row per column from the cached aggregates; non-numeric columns
+        # only report their count.
+        out = []
+        for j, name in enumerate(self.headers):
+            st = self._col_stats(j)
+            if st is None:
+                out.append([name, self.rows, None, None, None, None, None, None])
+                continue
+            out.append([name, st.count, st.total, st.avg(), st.var(population),
+                        st.stdev(population), st.min, st.max])
+        headers = ['column', 'count', 'sum', 'avg', 'var', 'stdev', 'min', 'max']
+        return Table(len(out), len(headers), headers=headers, data=out)
+
     def min_table(self):
-        flat = self.flatten()
-        return min(flat) if flat else None
+        return min(self.min_cols()) if self.rows and self.cols else None
 
     def max_table(self):
-        flat = self.flatten()
-        return max(flat) if flat else None
+        return max(self.max_cols()) if self.rows and self.cols else None
 
     def min_rows(self):
-        return [min(r) if r else None for r in self.data]
+        par = _par_rows(self, 'min_rows')
+        if par is not None:
+            return par
+        m = self._numeric_stack()
+        if m is not None:
+            return m.min(axis=1).tolist()
+        return [min(r) if r else None for r in self._row_lists()]
 
     def max_rows(self):
-        return [max(r) if r else None for r in self.data]
+        par = _par_rows(self, 'max_rows')
+        if par is not None:
+            return par
+        m = self._numeric_stack()
+        if m is not None:
+            return m.max(axis=1).tolist()
+        return [max(r) if r else None for r in self._row_lists()]
 
     def min_cols(self):
-        return [min(self.data[r][c] for r in range(self.rows)) for c in range(self.cols)]
+        return self._agg_cols(lambda st: st.min, _col_min)
 
     def max_cols(self):
-        return [max(self.data[r][c] for r in range(self.rows)) for c in range(self.cols)]
-    
+        return self._agg_cols(lambda st: st.max, _col_max)
+
     def __str__(self):
+        cols = self._columns()
         # compute column-widths
+        cells = [[str(v) for v in _cells(cols[i])] for i in range(len(self.headers))]
         widths = []
         for i, h in enumerate(self.headers):
-            w = len(str(h))
-            for row in self.data:
-                w = max(w, len(str(row[i])))
-            widths.append(w)
+            widths.append(max([len(str(h))] + [len(s) for s in cells[i]]))
         # header line
         header = ' | '.join(str(h).ljust(widths[i]) for i, h in enumerate(self.headers))
         sep    = '-+-'.join('-' * widths[i] for i in range(len(self.headers)))
         # data lines
         rows = []
-        for row in self.data:
-            rows.append(' | '.join(str(row[i]).ljust(widths[i]) for i in range(len(self.headers))))
+        for row in zip(*cells):
+            rows.append(' | '.join(row[i].ljust(widths[i]) for i in range(len(self.headers))))
         return '\n'.join([header, sep] + rows)
 
     __repr__ = __str__
+import operator as _operator
+from itertools import repeat as _repeat
+
+_OPS = {'+': _operator.add, '-': _operator.sub, '*': _operator.mul,
+        '/': _operator.truediv, '%': _operator.mod}
+
+def _binop(op, a, b):
+    fn = _OPS[op]
+    if isinstance(a, SEQUENCE_TYPES):
+        if isinstance(b, SEQUENCE_TYPES):
+            return [fn(x, y) for x, y in zip(a, b)]
+        return [fn(x, b) for x in a]
+    if isinstance(b, SEQUENCE_TYPES):
+        return [fn(a, y) for y in b]
+    return fn(a, b)
+
+def _index(base, i):
+    if isinstance(base, Table):
+        return base.get_row(i)
+    return base[i]
+
+def _range(base, start, end):
+    if isinstance(base, Table):
+        return base.slice_rows(start, end)
+    return base[start:end]
+
+def _avg(xs):
+    return sum(xs) / len(xs)
 
-import matplotlib.pyplot as plt
-
-def plot_table_heatmap(table):
-    data = table.data
-    fig, ax = plt.subplots()
-    cax = ax.imshow(data, aspect='auto', interpolation='nearest')
-    ax.set_xticks(range(table.cols))
-    ax.set_xticklabels(table.headers)
-    ax.set_yticks(range(table.rows))
-    ax.set_yticklabels(range(table.rows))
-    plt.colorbar(cax, ax=ax)
-    plt.title("Table heatmap")
-    plt.show()
-
-def bar_chart(labels, values, title=None):
-    fig, ax = plt.subplots()
-    ax.bar(labels, values)
-    if title: ax.set_title(title)
-    plt.show()
-
-def line_chart(x, y, title=None):
-    fig, ax = plt.subplots()
-    ax.plot(x, y, marker='o')
-    if title: ax.set_title(title)
-    ax.set_xlabel("x")
-    ax.set_ylabel("y")
-    plt.show()
-
-def scatter_plot(x, y, title=None):
-    fig, ax = plt.subplots()
-    ax.scatter(x, y)
-    if title: ax.set_title(title)
-    plt.show()
-
-def histogram(data, bins=10, title=None):
-    fig, ax = plt.subplots()
-    ax.hist(data, bins=bins)
-    if title: ax.set_title(title)
-    plt.show()
-
-def plot_table(table_val):
-    fig, ax = plt.subplots()
-    ax.axis('off')
-    tbl = ax.table(cellText=table_val.data, colLabels=table_val.headers, loc="center")
-    tbl.auto_set_font_size(False)
-    tbl.scale(1, 1.5)
-    plt.title("Table View")
-    plt.show()
-
-def line_chart_table(table):
-    labels = [str(h) for h in table.headers]
-    x = list(range(len(labels)))
-    fig, ax = plt.subplots()
-    for idx, row in enumerate(table.data, start=1):
-        ax.plot(x, row, marker='o', label=f"Series {idx}")
-    ax.set_xticks(x)
-    ax.set_xticklabels(labels, rotation=45, ha='right')
-    ax.set_xlabel("Header")
-    ax.set_ylabel("Value")
-    plt.title("All Series")
-    ax.legend()
-    plt.tight_layout()
-    plt.show()
+def _plugin(module, name):
+    __import__(module)
+    return __import__('wizual_builtins').BUILTINS[name]
 
 def main():
     x=5
@@ -335,12 +1445,12 @@ def main():
     c.append_row([1, 2, 3])
     c.append_row([4, 3, 2])
     c.append_row([5, 6, 7])
-    print(((x+y) if not isinstance(x, list) and not isinstance(y, list) else ([a+b for a,b in zip(x,y)] if isinstance(x, list) and isinstance(y, list) else ([elem+y for elem in x] if isinstance(x, list) else ([x+elem for elem in y])))))
-    print(((y+z) if not isinstance(y, list) and not isinstance(z, list) else ([a+b for a,b in zip(y,z)] if isinstance(y, list) and isinstance(z, list) else ([elem+z for elem in y] if isinstance(y, list) else ([y+elem for elem in z])))))
-    print(((z+y) if not isinstance(z, list) and not isinstance(y, list) else ([a+b for a,b in zip(z,y)] if isinstance(z, list) and isinstance(y, list) else ([elem+y for elem in z] if isinstance(z, list) else ([z+elem for elem in y])))))
-    print(((z+a) if not isinstance(z, list) and not isinstance(a, list) else ([a+b for a,b in zip(z,a)] if isinstance(z, list) and isinstance(a, list) else ([elem+a for elem in z] if isinstance(z, list) else ([z+elem for elem in a])))))
-    print(((a+b) if not isinstance(a, list) and not isinstance(b, list) else ([a+b for a,b in zip(a,b)] if isinstance(a, list) and isinstance(b, list) else ([elem+b for elem in a] if isinstance(a, list) else ([a+elem for elem in b])))))
-    print(((b+c) if not isinstance(b, list) and not isinstance(c, list) else ([a+b for a,b in zip(b,c)] if isinstance(b, list) and isinstance(c, list) else ([elem+c for elem in b] if isinstance(b, list) else ([b+elem for elem in c])))))
+    print((x+y))
+    print([_a+_b for _a, _b in zip(_repeat(y), z)])
+    print([_a+_b for _a, _b in zip(z, _repeat(y))])
+    print([_a+_b for _a, _b in zip(z, a)])
+    print([_a+_b for _a, _b in zip(a, b)])
+    print([_a+_b for _a, _b in zip(b, _repeat(c))])
     d=[c, a]
     print(sum(d))
 
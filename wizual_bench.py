@@ -0,0 +1,444 @@
+import argparse
+import csv
+import operator
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import wizual_helper
+from wizual_helper import Table
+
+
+def timed(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def random_table(rows, cols, seed=0):
+    rnd = random.Random(seed)
+    return Table(rows, cols, data=[[rnd.random() for _ in range(cols)] for _ in range(rows)])
+
+
+def naive_matmul(a, b):
+    x, y = a.data, b.data
+    x = [list(r) for r in x]
+    y = [list(r) for r in y]
+    out = [[0.0] * b.cols for _ in range(a.rows)]
+    for i in range(a.rows):
+        for j in range(b.cols):
+            acc = 0.0
+            for k in range(a.cols):
+                acc += x[i][k] * y[k][j]
+            out[i][j] = acc
+    return out
+
+
+def bench_matmul(args):
+    n = args.size or 200
+    a, b = random_table(n, n, 1), random_table(n, n, 2)
+    print(f"matmul {n}x{n} @ {n}x{n}")
+    print(f"  triple loop      {timed(lambda: naive_matmul(a, b), 1):9.4f}s")
+    rows, cols = a._row_lists(), [wizual_helper._cells(c) for c in b._columns()]
+    print(f"  blocked python   {timed(lambda: wizual_helper._matmul_blocked(rows, cols)):9.4f}s")
+    if wizual_helper.np is not None:
+        print(f"  numpy / BLAS     {timed(lambda: wizual_helper.matmul(a, b)):9.4f}s")
+    else:
+        print("  numpy / BLAS     (numpy not installed)")
+
+
+def legacy_read_csv(path):
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    data = []
+    for row in rows[1:]:
+        clean = []
+        for cell in row:
+            try:
+                clean.append(float(cell) if '.' in cell else int(cell))
+            except Exception:
+                clean.append(cell)
+        data.append(clean)
+    return Table(rows=len(data), cols=len(rows[0]), headers=rows[0], data=data)
+
+
+def write_csv(path, rows, string_cols=8, numeric_cols=4, seed=0):
+    rnd = random.Random(seed)
+    words = ['alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta']
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow([f"s{i}" for i in range(string_cols)] + [f"n{i}" for i in range(numeric_cols)])
+        for _ in range(rows):
+            w.writerow([rnd.choice(words) for _ in range(string_cols)]
+                       + [rnd.randint(0, 1000) for _ in range(numeric_cols // 2)]
+                       + [round(rnd.random() * 100, 3) for _ in range(numeric_cols - numeric_cols // 2)])
+
+
+def bench_csv(args):
+    n = args.size or 100000
+    fd, path = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        write_csv(path, n)
+        print(f"readCSV {n} rows x 12 cols (8 string, 4 numeric)")
+        print(f"  per-cell try/except  {timed(lambda: legacy_read_csv(path)):9.4f}s")
+        print(f"  column inference     {timed(lambda: wizual_helper.read_csv(path)):9.4f}s")
+    finally:
+        os.remove(path)
+
+
+def bench_stream(args):
+    n = args.size or 100000
+    ticks = 200
+    print(f"append a row then query column stats, {n}-row table, {ticks} ticks")
+
+    base = random_table(n, 8)
+
+    def stream(rescan):
+        t = Table._from_columns(base._columns(), base.headers)
+        for i in range(ticks):
+            t.append_row([float(i)] * 8)
+            if rescan:
+                t._stats = None
+            t.avg_cols(), t.var_cols(), t.max_cols()
+    print(f"  rescan each tick     {timed(lambda: stream(True), 1):9.4f}s")
+    print(f"  incremental state    {timed(lambda: stream(False), 1):9.4f}s")
+
+
+def col_binop(fn, a, b):
+    # one eagerly materialised element-wise step, as Table operators did
+    # before lazy plans
+    if wizual_helper.np is not None and not isinstance(a, list) and not isinstance(b, list):
+        return fn(a, b)
+    if not isinstance(b, (list, wizual_helper.array)):
+        return wizual_helper._to_column([fn(x, b) for x in wizual_helper._cells(a)])
+    return wizual_helper._to_column(list(map(fn, wizual_helper._cells(a), wizual_helper._cells(b))))
+
+
+def bench_lazy(args):
+    n = args.size or 1000000
+    t = random_table(n, 8, 5)
+    names = t.headers[:2]
+
+    def eager():
+        # the pre-plan behaviour: every step copies its result into a new Table
+        cols = t._columns()
+        picked = [cols[t.headers.index(name)][:] for name in names]
+        picked = [c.copy() if hasattr(c, 'copy') else c for c in picked]
+        step = Table._from_columns([c[0:100] for c in picked], names, 100)
+        step = Table._from_columns([col_binop(operator.mul, c, 2) for c in step._columns()], names, 100)
+        return step.sum_cols()
+
+    def eager_chain():
+        step = Table._from_columns([col_binop(operator.mul, c, 2) for c in t._columns()], t.headers, n)
+        step = Table._from_columns([col_binop(operator.add, c, 1) for c in step._columns()], t.headers, n)
+        step = Table._from_columns([col_binop(operator.sub, c, 3) for c in step._columns()], t.headers, n)
+        return step.sum_cols()
+
+    # rows appended to a lazy table must reach everything derived from it
+    s = t.slice_rows(0, 2) * 10
+    s.append_row([0.0] * 8)
+    assert s.get_row(2) == [0.0] * 8 and (s + 1).get_row(2) == [1.0] * 8
+    assert s.slice_rows(0, 3).rows == 3 and list(s.get_col(0))[2] == 0.0
+    # a plan reused on both sides must not grow without bound
+    for _ in range(64):
+        s = s + s
+    assert s._ops < 2 * wizual_helper.LAZY_MAX_OPS and s.get_row(2) == [0.0] * 8
+    # int results that do not fit in int64 come back as exact Python ints
+    big = Table(3, 1, data=[[4 * 10 ** 18]] * 3)
+    assert big.sum_cols() == [12 * 10 ** 18] and big.avg_cols() == [4e18]
+    assert (big * 3).get_row(0) == [12 * 10 ** 18]
+    print(f"sumCols(cols(t, [2 of 8])[0:100] * 2), {n}-row table")
+    print(f"  materialise each step  {timed(eager):9.6f}s")
+    print(f"  lazy plan              {timed(lambda: (t.select_cols(names).slice_rows(0, 100) * 2).sum_cols()):9.6f}s")
+    print(f"sumCols(t * 2 + 1 - 3), {n}x8 table")
+    print(f"  materialise each step  {timed(eager_chain):9.6f}s")
+    print(f"  fused plan             {timed(lambda: (t * 2 + 1 - 3).sum_cols()):9.6f}s")
+
+
+def bench_views(args):
+    n = args.size or 1000000
+    t = random_table(n, 4, 6)
+    # views of a lazy table include rows appended after the plan was built
+    s = t.slice_rows(0, 2) * 2
+    s.append_rows([[0.0] * 4])
+    assert list(s.get_col(1))[2] == 0.0 and s.select_cols(s.headers[:1]).get_row(2) == [0.0]
+    print(f"column and row-range access, {n}-row table")
+    print(f"  getCol as list copy    {timed(lambda: list(wizual_helper._cells(t._columns()[1]))):9.6f}s")
+    print(f"  getCol view            {timed(lambda: t.get_col(1)):9.6f}s")
+    print(f"  getCol view [10:20]    {timed(lambda: t.get_col(1)[10:20].tolist()):9.6f}s")
+    print(f"  t[0:n/2] copied        {timed(lambda: [c[0:n // 2].copy() if hasattr(c, 'copy') else c[0:n // 2] for c in t._columns()]):9.6f}s")
+    print(f"  t[0:n/2] view          {timed(lambda: t.slice_rows(0, n // 2)._columns()):9.6f}s")
+
+
+def bench_headers(args):
+    n = args.size or 300
+    t = Table(10, n, headers=[f"col{i}" for i in range(n)])
+    names = list(reversed(t.headers))
+    print(f"resolve {n} column names on a {n}-column table")
+    print(f"  headers.index per name {timed(lambda: [t.headers.index(h) for h in names]):9.6f}s")
+    print(f"  header index map       {timed(lambda: [t.col_index(h) for h in names]):9.6f}s")
+
+
+def bench_bulk(args):
+    n = args.size or 100000
+    rnd = random.Random(5)
+    rows = [[rnd.random() for _ in range(8)] for _ in range(n)]
+    idx = list(range(0, n, 2))
+    vals = [1.0] * len(idx)
+
+    def per_row():
+        t = Table(0, 8)
+        for r in rows:
+            t.append_row(r)
+        for i in idx:
+            t.update_cell(i, 3, 1.0)
+        return t.sum_cols()
+
+    def bulk():
+        t = Table(0, 8)
+        t.append_rows(rows)
+        t.update_cells(idx, 3, vals)
+        return t.sum_cols()
+
+    print(f"append {n} rows x 8 cols, then update {len(idx)} cells")
+    print(f"  appendRow/updateCell    {timed(per_row):9.4f}s")
+    print(f"  appendRows/updateCells  {timed(bulk):9.4f}s")
+
+
+def bench_parallel(args):
+    n = args.size or 1000000
+    t = random_table(n, 8, 3)
+    m = random_table(8, 8, 4)
+    ops = [
+        ('column stats', lambda: (setattr(t, '_stats', None), t.var_cols())),
+        ('sum_rows', t.sum_rows),
+        ('t * 2 + t', lambda: (t * 2 + t)._columns()),
+        ('t @ 8x8', lambda: t @ m),
+    ]
+    print(f"{n}x8 table, best of 3, across worker counts")
+    print("  " + "".ljust(14) + "".join(f"{w:>10}" for w in (1, 2, 4, 8)))
+    try:
+        for name, fn in ops:
+            times = []
+            for w in (1, 2, 4, 8):
+                wizual_helper.set_workers(w, min_cells=0)
+                times.append(timed(fn))
+            print(f"  {name:<14}" + "".join(f"{dt:9.4f}s" for dt in times))
+    finally:
+        wizual_helper.set_workers(1, min_cells=wizual_helper.PARALLEL_MIN_CELLS)
+    print(f"  ({os.cpu_count()} CPUs; numpy {'on' if wizual_helper.np is not None else 'off'})")
+
+
+def bench_table_file(args):
+    n = args.size or 1000000
+    fd, csv_path = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    bin_path = csv_path[:-4] + '.wzt'
+    try:
+        write_csv(csv_path, n, string_cols=2, numeric_cols=10)
+        t = wizual_helper.read_csv(csv_path)
+        numeric = [f"n{i}" for i in range(10)]
+        print(f"{n} rows x 12 cols (2 string, 10 numeric)")
+        print(f"  readCSV              {timed(lambda: wizual_helper.read_csv(csv_path), 1):9.4f}s")
+        print(f"  writeTable           {timed(lambda: wizual_helper.write_table(t, bin_path), 1):9.4f}s")
+        print(f"  readTable            {timed(lambda: wizual_helper.read_table(bin_path)):9.4f}s")
+        print(f"  readTable + sumCols  {timed(lambda: wizual_helper.read_table(bin_path).select_cols(numeric).sum_cols()):9.4f}s")
+    finally:
+        for p in (csv_path, bin_path):
+            if os.path.exists(p):
+                os.remove(p)
+
+
+WHILE_LOOP = """
+i = 0;
+s = 0;
+xs = [1, 2, 3];
+while (i < %d) {
+    s = s + i * 2 - 1;
+    xs = xs + 1;
+    if (i > 10) { s = s / 2; }
+    i = i + 1;
+}
+"""
+
+
+def bench_interp(args):
+    from wizual_parser import parser
+    from wizual_interpreter import compile_node, evaluate
+    n = args.size or 20000
+    ast = parser.parse(WHILE_LOOP % n)
+    print(f"while loop, {n} iterations")
+    print(f"  tree walker      {timed(lambda: evaluate(ast, {})):9.4f}s")
+    print(f"  closures         {timed(lambda: compile_node(ast)({})):9.4f}s")
+
+
+CONSTANT_LOOP = """
+i = 0;
+s = 0;
+while (i < %d) {
+    s = s + (60 * 60 * 24) / 2 + [1, 2, 3][1];
+    if (1 > 2) { s = 0; }
+    if (2 * 3 == 6) { i = i + 1; }
+}
+"""
+
+
+def bench_optimizer(args):
+    from wizual_parser import parser
+    from wizual_interpreter import compile_node
+    from wizual_optimizer import optimize
+    n = args.size or 20000
+    ast = parser.parse(CONSTANT_LOOP % n)
+    stats = {}
+    folded = optimize(ast, stats)
+    print(f"loop over constant expressions, {n} iterations "
+          f"({stats['folded']} folded, {stats['pruned']} branches pruned)")
+    print(f"  as parsed        {timed(lambda: compile_node(ast)({})):9.4f}s")
+    print(f"  optimized        {timed(lambda: compile_node(folded)({})):9.4f}s")
+    print(f"  optimize pass    {timed(lambda: optimize(ast)):9.6f}s")
+
+
+def run_python(code_or_args, cwd=None):
+    argv = code_or_args if isinstance(code_or_args, list) else ['-c', code_or_args]
+    subprocess.run([sys.executable] + argv, cwd=cwd, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def bench_startup(args):
+    here = os.path.dirname(os.path.abspath(__file__))
+    n = args.size or 5
+    rebuild = ("import sys; sys.path.insert(0, %r); import ply.yacc as yacc, wizual_parser; "
+               "yacc.yacc(module=wizual_parser, tabmodule='_wizual_no_tab', debug=False, "
+               "write_tables=False)" % here)
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, 'trivial.viz')
+        with open(script, 'w') as f:
+            f.write('x = 1;\n')
+        out = os.path.join(tmp, 'out.py')
+        print(f"process startup, best of {n} runs")
+        print(f"  python -c pass              {timed(lambda: run_python('pass'), n):9.4f}s")
+        print(f"  wizuall.py trivial.viz      "
+              f"{timed(lambda: run_python([os.path.join(here, 'wizuall.py'), script, '-c', out], tmp), n):9.4f}s")
+        cached = "import sys; sys.path.insert(0, %r); import wizual_parser" % here
+        print(f"  parser import, cached table {timed(lambda: run_python(cached), n):9.4f}s")
+        print(f"  parser import, no table     {timed(lambda: run_python(rebuild), n):9.4f}s")
+
+
+COMPUTE_ONLY = """t = table(cols=3, headers=["a", "b", "c"]);
+appendRows(t, [[1, 2, 3], [4, 5, 6], [7, 8, 9]]);
+s = sumCols(t);
+print(s);
+if (s[0] > 100) { lineChart(getCol(t, 0), getCol(t, 1)); }
+"""
+
+
+def import_times(argv, cwd):
+    # top-level modules imported by `python -X importtime argv`, as
+    # (cumulative seconds, name), slowest first
+    proc = subprocess.run([sys.executable, '-X', 'importtime'] + argv, cwd=cwd, check=True,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    out = []
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit() and not parts[2].startswith('  '):
+            out.append((int(parts[1]) / 1e6, parts[2].strip()))
+    return sorted(out, reverse=True)
+
+
+def bench_importtime(args):
+    # startup report for a script that only computes: the chart call sits in
+    # a branch that never runs, so matplotlib must not be imported
+    here = os.path.dirname(os.path.abspath(__file__))
+    n = args.size or 8
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, 'compute.viz')
+        with open(script, 'w') as f:
+            f.write(COMPUTE_ONLY)
+        out = os.path.join(tmp, 'out.py')
+        wizuall = os.path.join(here, 'wizuall.py')
+        run_python([wizuall, script, '-c', out], tmp)
+        for label, argv in (("interpreter", [wizuall, script, '-c', '', '--no-cache']),
+                            ("compiled script", [out])):
+            times = import_times(argv, tmp)
+            names = {name.split('.')[0] for _, name in times}
+            print(f"{label}: {sum(t for t, _ in times):.4f}s in imports, "
+                  f"matplotlib {'imported' if 'matplotlib' in names else 'not imported'}")
+            for t, name in times[:n]:
+                print(f"  {name:<28}{t:9.4f}s")
+        t, _ = import_times(['-c', 'import matplotlib.pyplot'], tmp)[0]
+        print(f"(import matplotlib.pyplot alone: {t:.4f}s)")
+
+
+def big_script(n):
+    body = [WHILE_LOOP % 10]
+    for i in range(n):
+        body.append(f"t{i} = table(rows=2, cols=2, data=[[{i}, 1], [2, 3]]);\n"
+                    f"if (t{i} == t{i}) {{ v{i} = sumTable(t{i}) * {i} + [1, 2][0]; }}\n")
+    return "".join(body)
+
+
+def bench_cache(args):
+    from wizual_cache import load_ast
+    from wizual_parser import parse
+    here = os.path.dirname(os.path.abspath(__file__))
+    n = args.size or 2000
+    code = big_script(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'cache')
+        script = os.path.join(tmp, 'big.viz')
+        with open(script, 'w') as f:
+            f.write(code)
+        out = os.path.join(tmp, 'out.py')
+        print(f"AST cache, {len(code.splitlines())}-line script")
+        print(f"  parse             {timed(lambda: parse(code)):9.4f}s")
+        load_ast(code, cache_dir)
+        print(f"  cache hit         {timed(lambda: load_ast(code, cache_dir)):9.4f}s")
+        argv = [os.path.join(here, 'wizuall.py'), script, '-c', out, '--cache-dir', cache_dir]
+
+        def cold():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            run_python(argv, tmp)
+        print(f"  wizuall.py cold   {timed(cold):9.4f}s")
+        print(f"  wizuall.py warm   {timed(lambda: run_python(argv, tmp)):9.4f}s")
+
+
+BENCHMARKS = {
+    'matmul': bench_matmul,
+    'csv': bench_csv,
+    'tablefile': bench_table_file,
+    'stream': bench_stream,
+    'parallel': bench_parallel,
+    'lazy': bench_lazy,
+    'views': bench_views,
+    'headers': bench_headers,
+    'bulk': bench_bulk,
+    'interp': bench_interp,
+    'optimizer': bench_optimizer,
+    'startup': bench_startup,
+    'importtime': bench_importtime,
+    'cache': bench_cache,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="wizual_bench")
+    parser.add_argument('names', nargs='*', help="Benchmarks to run (default: all)")
+    parser.add_argument('--size', type=int, default=None, help="Problem size override")
+    args = parser.parse_args()
+    for name in args.names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark '{name}' (choose from {', '.join(BENCHMARKS)})")
+        BENCHMARKS[name](args)
+
+
+if __name__ == "__main__":
+    main()
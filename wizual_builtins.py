@@ -0,0 +1,135 @@
+import importlib
+from operator import methodcaller
+from types import MappingProxyType
+from wizual_helper import Table, SEQUENCE_TYPES, read_csv_builtin, read_table, write_table
+
+# Builtin registry shared by the interpreter and the code generator. The table
+# is built once at import and exposed read-only as BUILTINS; plug-ins extend it
+# through register_builtin() instead of editing the interpreter.
+
+class Builtin:
+    __slots__ = ('name', 'fn', 'min_args', 'max_args', 'scoped', 'returns')
+
+    def __init__(self, name, fn, min_args, max_args=None, scoped=False, returns=None):
+        self.name = name
+        self.fn = fn
+        self.min_args = min_args
+        self.max_args = min_args if max_args is None else max_args
+        self.scoped = scoped
+        self.returns = returns
+
+    def arity_error(self, n):
+        lo, hi = self.min_args, self.max_args
+        if lo <= n and (hi < 0 or n <= hi):
+            return None
+        if hi < 0:
+            expected = f"at least {lo} argument{'s' if lo != 1 else ''}"
+        elif lo == hi:
+            expected = f"{lo} argument{'s' if lo != 1 else ''}"
+        elif hi == lo + 1:
+            expected = f"{lo} or {hi} arguments"
+        else:
+            expected = f"{lo} to {hi} arguments"
+        return f"Function '{self.name}' expects {expected}, got {n}"
+
+    def __call__(self, args, sym):
+        err = self.arity_error(len(args))
+        if err:
+            raise TypeError(err)
+        return self.fn(args, sym) if self.scoped else self.fn(args)
+
+def _print(a):
+    for val in a:
+        print(val)
+    return None
+
+def _viz(fn_name, tables_only=False):
+    # wizual_viz pulls in matplotlib, so it is imported on first plot only
+    def call(a):
+        if tables_only and not isinstance(a[0], Table):
+            return None
+        import wizual_viz
+        return getattr(wizual_viz, fn_name)(*a)
+    return call
+
+TABLE_METHODS = {
+    'sumTable':   'sum_table',
+    'sumRows':    'sum_rows',
+    'sumCols':    'sum_cols',
+    'avgTable':   'avg_table',
+    'avgRows':    'avg_rows',
+    'avgCols':    'avg_cols',
+    'varTable':   'var_table',
+    'stdevTable': 'stdev_table',
+    'varRows':    'var_rows',
+    'stdevRows':  'stdev_rows',
+    'varCols':    'var_cols',
+    'stdevCols':  'stdev_cols',
+    'minTable':   'min_table',
+    'maxTable':   'max_table',
+    'minRows':    'min_rows',
+    'maxRows':    'max_rows',
+    'minCols':    'min_cols',
+    'maxCols':    'max_cols',
+}
+
+_registry = {}
+BUILTINS = MappingProxyType(_registry)
+
+def register_builtin(name, fn, min_args, max_args=None, scoped=False, replace=False, returns=None):
+    # `fn` receives the evaluated argument list, plus the symbol table when
+    # `scoped`; max_args=-1 means variadic. `returns` is the static result
+    # type used by wizual_types ('number', 'string', 'list', 'Table' or None).
+    if name in _registry and not replace:
+        raise ValueError(f"Builtin '{name}' is already registered")
+    _registry[name] = Builtin(name, fn, min_args, max_args, scoped, returns)
+    return fn
+
+def load_plugins(modules):
+    # plug-in modules register their builtins when imported
+    for mod in modules:
+        if mod:
+            importlib.import_module(mod)
+
+def arity_error(name, n):
+    b = _registry.get(name)
+    return b.arity_error(n) if b else None
+
+for _name, _fn, _lo, _hi, _returns in [
+    ("print",     _print,                                           0, -1, None),
+    ("sum",       lambda a: sum(a[0]) if isinstance(a[0], SEQUENCE_TYPES) else None, 1, 1, 'number'),
+    ("avg",       lambda a: sum(a[0]) / len(a[0]),                  1, 1, 'number'),
+    ("min",       lambda a: min(a[0]),                              1, 1, None),
+    ("max",       lambda a: max(a[0]),                              1, 1, None),
+    ("sort",      lambda a: sorted(a[0]),                           1, 1, 'list'),
+    ("reverse",   lambda a: list(reversed(a[0])),                   1, 1, 'list'),
+    ("getRow",    lambda a: a[0].get_row(a[1]),                     2, 2, 'list'),
+    ("getCol",    lambda a: a[0].get_col(a[1]),                     2, 2, 'list'),
+    ("getColByName", lambda a: a[0].get_col_by_name(a[1]),          2, 2, 'list'),
+    ("appendRow", lambda a: a[0].append_row(a[1]),                  2, 2, 'Table'),
+    ("updateCell", lambda a: a[0].update_cell(a[1], a[2], a[3]),    4, 4, 'Table'),
+    ("appendRows", lambda a: a[0].append_rows(a[1]),                2, 2, 'Table'),
+    ("updateCells", lambda a: a[0].update_cells(a[1], a[2], a[3]),  4, 4, 'Table'),
+    ("fillCol",   lambda a: a[0].fill_col(a[1], a[2]),              3, 3, 'Table'),
+    ("cols",      lambda a: a[0].select_cols(a[1]),                 2, 2, 'Table'),
+    ("describe",  lambda a: a[0].describe(),                        1, 1, 'Table'),
+    ("readCSV",   lambda a: read_csv_builtin(*a),                   1, 3, None),
+    ("hasChunk",  lambda a: a[0].has_next(),                        1, 1, None),
+    ("nextChunk", lambda a: a[0].next_chunk(),                      1, 1, 'Table'),
+    ("readTable", lambda a: read_table(a[0]),                       1, 1, 'Table'),
+    ("writeTable", lambda a: write_table(a[0], a[1]),               2, 2, 'Table'),
+    ("plotHeatmap", _viz('plot_table_heatmap'),                     1, 1, None),
+    ("barChart",  _viz('bar_chart'),                                2, 3, None),
+    ("lineChart", _viz('line_chart'),                               2, 4, None),
+    ("scatterPlot", _viz('scatter_plot'),                           2, 4, None),
+    ("histogram", _viz('histogram'),                                1, 3, None),
+    ("plotTable", _viz('plot_table', tables_only=True),             1, 2, None),
+    ("lineChartTable", _viz('line_chart_table', tables_only=True),  1, 2, None),
+]:
+    register_builtin(_name, _fn, _lo, _hi, returns=_returns)
+
+for _name, _method in TABLE_METHODS.items():
+    _returns = 'number' if _name.endswith('Table') else 'list'
+    register_builtin(_name, lambda a, f=methodcaller(_method): f(a[0]), 1, 1, returns=_returns)
+
+register_builtin("py", lambda a, sym: eval(a[0], globals(), sym), 1, 1, scoped=True)
@@ -0,0 +1,84 @@
+import hashlib
+import marshal
+import os
+from wizual_lexer import rules_signature
+from wizual_parser import grammar_signature, parse
+
+# Parsed-AST cache for .viz scripts, in the spirit of __pycache__. Entries are
+# keyed by a hash of the source plus CACHE_TAG, so editing a script, changing
+# the grammar or token rules, or bumping WIZUALL_VERSION all miss the cache.
+# The AST is plain tuples/lists/dicts and is stored with marshal; the closure
+# compile that follows is cheap next to lexing and parsing.
+
+WIZUALL_VERSION = '0.2'
+CACHE_DIR_NAME = '__vizcache__'
+CACHE_SUFFIX = '.ast'
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+CACHE_TAG = f"{WIZUALL_VERSION}:{rules_signature()}:{grammar_signature()}"
+
+def default_cache_dir(script_path):
+    return os.environ.get('WIZUALL_CACHE_DIR') or \
+        os.path.join(os.path.dirname(os.path.abspath(script_path)), CACHE_DIR_NAME)
+
+def cache_key(code):
+    return hashlib.sha256(f"{CACHE_TAG}\0{code}".encode()).hexdigest()
+
+def _load(path):
+    try:
+        with open(path, 'rb') as f:
+            ast = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    try:
+        # mtime doubles as the LRU clock
+        os.utime(path)
+    except OSError:
+        pass
+    return ast
+
+def _store(path, ast):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            marshal.dump(ast, f)
+        os.replace(tmp, path)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+    return True
+
+def prune(cache_dir, max_bytes=CACHE_MAX_BYTES):
+    # drop least recently used entries until the directory fits in max_bytes
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for e in it:
+                if e.name.endswith(CACHE_SUFFIX):
+                    st = e.stat()
+                    entries.append((st.st_mtime, st.st_size, e.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def load_ast(code, cache_dir, max_bytes=CACHE_MAX_BYTES):
+    if not cache_dir:
+        return parse(code)
+    path = os.path.join(cache_dir, cache_key(code) + CACHE_SUFFIX)
+    ast = _load(path)
+    if ast is None:
+        ast = parse(code)
+        if _store(path, ast):
+            prune(cache_dir, max_bytes)
+    return ast
@@ -1,189 +1,171 @@
 import os
+import re
+from wizual_builtins import BUILTINS, TABLE_METHODS, arity_error
+from wizual_optimizer import optimize
+from wizual_types import LIST, TABLE, UNKNOWN, infer_types, static_type
+from wizuall_runtime import EXPORTS, VIZ_FUNCTIONS
 
 class CodegenError(Exception):
     pass
 
-def emit_expression(node):
+def emit_expression(node, env=None):
     kind = node[0]
     if kind == 'number':
         return repr(node[1])
     if kind == 'string':
         return repr(node[1])
+    if kind == 'const':
+        return repr(node[1])
     if kind == 'var':
         return node[1]
     if kind == 'list':
-        elems = ', '.join(emit_expression(e) for e in node[1])
+        elems = ', '.join(emit_expression(e, env) for e in node[1])
         return f'[{elems}]'
     if kind == 'binop':
         op = node[1]
-        left_node, right_node = node[2], node[3]
-        L = emit_expression(left_node)
-        R = emit_expression(right_node)
+        L = emit_expression(node[2], env)
+        R = emit_expression(node[3], env)
         if op in ('+', '-', '*', '/', '%'):
-            return (
-                f'(({L}{op}{R}) if not isinstance({L}, list) and not isinstance({R}, list) '
-                f'else ([a{op}b for a,b in zip({L},{R})] if isinstance({L}, list) and isinstance({R}, list) '
-                f'else ([elem{op}{R} for elem in {L}] if isinstance({L}, list) '
-                f'else ([{L}{op}elem for elem in {R}]))))') 
+            lt, rt = static_type(node[2], env), static_type(node[3], env)
+            if UNKNOWN in (lt, rt):
+                return f'_binop({op!r}, {L}, {R})'
+            if lt == LIST and rt == LIST:
+                return f'[_a{op}_b for _a, _b in zip({L}, {R})]'
+            if lt == LIST:
+                return f'[_a{op}_b for _a, _b in zip({L}, _repeat({R}))]'
+            if rt == LIST:
+                return f'[_a{op}_b for _a, _b in zip(_repeat({L}), {R})]'
+            return f'({L}{op}{R})'
+        if op == '@':
+            return f'matmul({L}, {R})'
         return f'({L}{op}{R})'
     if kind == 'slice':
-        base = emit_expression(node[1])
+        base = emit_expression(node[1], env)
         sl = node[2]
+        bt = static_type(node[1], env)
         if sl[0] == 'index':
-            return (
-                f'({base}.data[{sl[1]}] if isinstance({base}, Table) '
-                f'else {base}[{sl[1]}])'
-            )
+            if bt == LIST:
+                return f'{base}[{sl[1]}]'
+            if bt == TABLE:
+                return f'{base}.get_row({sl[1]})'
+            return f'_index({base}, {sl[1]})'
         if sl[0] == 'range':
-            start, end = sl[1], sl[2]
-            return (
-                f'(Table(rows=len({base}.data[{start}:{end}]), cols={base}.cols, '
-                f'headers={base}.headers, data={base}.data[{start}:{end}]) '
-                f'if isinstance({base}, Table) '
-                f'else {base}[{start}:{end}])'
-            )
+            if bt == LIST:
+                return f'{base}[{sl[1]}:{sl[2]}]'
+            if bt == TABLE:
+                return f'{base}.slice_rows({sl[1]}, {sl[2]})'
+            return f'_range({base}, {sl[1]}, {sl[2]})'
+        if sl[0] == 'column':
+            return f'{base}.get_col_by_name({sl[1]!r})'
+        if sl[0] == 'columns':
+            return f'{base}.col_range({sl[1]!r}, {sl[2]!r})'
         raise CodegenError(f'Unknown slice type: {sl[0]}')
     if kind == 'bool':
         op = node[1]
-        left = emit_expression(node[2])
-        right= emit_expression(node[3])
+        left = emit_expression(node[2], env)
+        right= emit_expression(node[3], env)
         return f'({left}{op}{right})'
     if kind == 'call':
         name = node[1]
         args = node[2]
+        err = arity_error(name, len(args))
+        if err:
+            raise CodegenError(err)
         if name == 'readCSV':
-            if len(args) != 1:
-                raise CodegenError(f"Function 'readCSV' expects 1 argument, got {len(args)}")
-            return f"read_csv({emit_expression(args[0])})"
+            if len(args) > 1:
+                return f"read_csv_builtin({', '.join(emit_expression(a, env) for a in args)})"
+            return f"read_csv({emit_expression(args[0], env)})"
+        if name == 'readTable':
+            return f"read_table({emit_expression(args[0], env)})"
+        if name == 'writeTable':
+            return f"write_table({emit_expression(args[0], env)}, {emit_expression(args[1], env)})"
+        if name in ('hasChunk', 'nextChunk'):
+            method = 'has_next' if name == 'hasChunk' else 'next_chunk'
+            return f"{emit_expression(args[0], env)}.{method}()"
         if name == 'plotTable':
-            if len(args) != 1:
-                raise CodegenError(f"Function 'plotTable' expects 1 argument, got {len(args)}")
-            return f"plot_table({emit_expression(args[0])})"
+            return f"plot_table({', '.join(emit_expression(a, env) for a in args)})"
         if name in ('sum','avg','min','max','sort','reverse'):
-            if len(args) != 1:
-                raise CodegenError(f"Function '{name}' expects 1 argument, got {len(args)}")
-            expr = emit_expression(args[0])
+            expr = emit_expression(args[0], env)
             if name == 'sum':     return f"sum({expr})"
-            if name == 'avg':     return f"(sum({expr})/len({expr}))"
+            if name == 'avg':     return f"_avg({expr})"
             if name == 'min':     return f"min({expr})"
             if name == 'max':     return f"max({expr})"
             if name == 'sort':    return f"sorted({expr})"
             if name == 'reverse': return f"list(reversed({expr}))"
         if name == 'appendRow':
-            if len(args) != 2:
-                raise CodegenError(f"Function 'appendRow' expects 2 arguments, got {len(args)}")
-            tab  = emit_expression(args[0])
-            vals = emit_expression(args[1])
+            tab  = emit_expression(args[0], env)
+            vals = emit_expression(args[1], env)
             return f"{tab}.append_row({vals})"
         if name == 'updateCell':
-            if len(args) != 4:
-                raise CodegenError(f"Function 'updateCell' expects 4 arguments, got {len(args)}")
-            tab = emit_expression(args[0])
-            r   = emit_expression(args[1])
-            c   = emit_expression(args[2])
-            v   = emit_expression(args[3])
+            tab = emit_expression(args[0], env)
+            r   = emit_expression(args[1], env)
+            c   = emit_expression(args[2], env)
+            v   = emit_expression(args[3], env)
             return f"{tab}.update_cell({r},{c},{v})"
+        if name in ('appendRows', 'updateCells', 'fillCol'):
+            method = {'appendRows': 'append_rows', 'updateCells': 'update_cells', 'fillCol': 'fill_col'}[name]
+            tab = emit_expression(args[0], env)
+            rest = ', '.join(emit_expression(a, env) for a in args[1:])
+            return f"{tab}.{method}({rest})"
         if name == 'getRow':
-            if len(args) != 2:
-                raise CodegenError(f"Function 'getRow' expects 2 arguments, got {len(args)}")
-            return f"{emit_expression(args[0])}.data[{emit_expression(args[1])}]"
+            return f"{emit_expression(args[0], env)}.get_row({emit_expression(args[1], env)})"
         if name == 'getCol':
-            if len(args) != 2:
-                raise CodegenError(f"Function 'getCol' expects 2 arguments, got {len(args)}")
-            tbl = emit_expression(args[0])
-            idx = emit_expression(args[1])
-            return f"[row[{idx}] for row in {tbl}.data]"
+            return f"{emit_expression(args[0], env)}.get_col({emit_expression(args[1], env)})"
+        if name == 'getColByName':
+            return f"{emit_expression(args[0], env)}.get_col_by_name({emit_expression(args[1], env)})"
+        if name == 'describe':
+            return f"{emit_expression(args[0], env)}.describe()"
         if name == 'py':
-            if len(args) != 1:
-                raise CodegenError(f"Function 'py' expects 1 argument, got {len(args)}")
-            return f"eval({emit_expression(args[0])})"
+            return f"eval({emit_expression(args[0], env)})"
         if name == 'cols':
-            if len(args) != 2:
-                raise CodegenError(f"Function 'cols' expects 2 arguments, got {len(args)}")
-            tbl = emit_expression(args[0])
-            hdr = emit_expression(args[1])
-            return (
-                f"Table(rows={tbl}.rows, cols=len({hdr}), headers={hdr}, "
-                f"data=[[row[{tbl}.headers.index(c)] for c in {hdr}] for row in {tbl}.data])"
-            )
-        if name in ('sumTable','sumRows','sumCols',
-                    'avgTable','avgRows','avgCols',
-                    'varTable','stdevTable',
-                    'varRows','stdevRows',
-                    'varCols','stdevCols',
-                    'minTable','maxTable',
-                    'minRows','maxRows',
-                    'minCols','maxCols'):
-            if len(args) != 1:
-                raise CodegenError(f"Function '{name}' expects 1 argument, got {len(args)}")
-            tbl = emit_expression(args[0])
-            method = {
-                'sumTable':   'sum_table',
-                'sumRows':    'sum_rows',
-                'sumCols':    'sum_cols',
-                'avgTable':   'avg_table',
-                'avgRows':    'avg_rows',
-                'avgCols':    'avg_cols',
-                'varTable':   'var_table',
-                'stdevTable': 'stdev_table',
-                'varRows':    'var_rows',
-                'stdevRows':  'stdev_rows',
-                'varCols':    'var_cols',
-                'stdevCols':  'stdev_cols',
-                'minTable':   'min_table',
-                'maxTable':   'max_table',
-                'minRows':    'min_rows',
-                'maxRows':    'max_rows',
-                'minCols':    'min_cols',
-                'maxCols':    'max_cols'
-            }[name]
-            return f"{tbl}.{method}()"
+            return f"{emit_expression(args[0], env)}.select_cols({emit_expression(args[1], env)})"
+        if name in TABLE_METHODS:
+            return f"{emit_expression(args[0], env)}.{TABLE_METHODS[name]}()"
         if name == 'plotHeatmap':
-            if len(args) != 1:
-                raise CodegenError(f"Function 'plotHeatmap' expects 1 argument, got {len(args)}")
-            return f"plot_table_heatmap({emit_expression(args[0])})"
+            return f"plot_table_heatmap({emit_expression(args[0], env)})"
         if name in ('barChart','lineChart','scatterPlot'):
-            expected = 2
-            if name in ('barChart','lineChart','scatterPlot'):
-                if len(args) < 2 or len(args) > 3:
-                    raise CodegenError(f"Function '{name}' expects 2 or 3 arguments, got {len(args)}")
             fn = {
                 'barChart':      'bar_chart',
                 'lineChart':     'line_chart',
                 'scatterPlot':   'scatter_plot'
             }[name]
-            a0 = emit_expression(args[0])
-            a1 = emit_expression(args[1])
-            a2 = emit_expression(args[2]) if len(args) == 3 else None
+            a0 = emit_expression(args[0], env)
+            a1 = emit_expression(args[1], env)
+            a2 = emit_expression(args[2], env) if len(args) > 2 else None
+            if len(args) == 4:
+                return f"{fn}({a0},{a1},{a2},{emit_expression(args[3], env)})"
             return f"{fn}({a0},{a1},{a2})"
         if name == 'histogram':
-            if len(args) < 1 or len(args) > 3:
-                raise CodegenError(f"Function 'histogram' expects 1 to 3 arguments, got {len(args)}")
-            data = emit_expression(args[0])
-            bins = emit_expression(args[1]) if len(args) > 1 else 10
-            title= emit_expression(args[2]) if len(args) > 2 else None
+            data = emit_expression(args[0], env)
+            bins = emit_expression(args[1], env) if len(args) > 1 else 10
+            title= emit_expression(args[2], env) if len(args) > 2 else None
             return f"histogram({data},{bins},{title})"
         if name == 'lineChartTable':
-            if len(args) != 1:
-                raise CodegenError(f"Function 'lineChartTable' expects 1 argument, got {len(args)}")
-            return f"line_chart_table({emit_expression(args[0])})"
-        call_args = ', '.join(emit_expression(a) for a in args)
+            return f"line_chart_table({', '.join(emit_expression(a, env) for a in args)})"
+        call_args = ', '.join(emit_expression(a, env) for a in args)
+        builtin = BUILTINS.get(name)
+        if builtin is not None and builtin.fn.__module__ != 'wizual_builtins':
+            # plug-in builtin: generated code imports its module and calls it
+            # through the registry, passing the argument list the same way the
+            # interpreter does (the function may be a lambda or a closure)
+            fn = f"_plugin({builtin.fn.__module__!r}, {name!r})"
+            return f"{fn}([{call_args}], {'locals()' if builtin.scoped else 'None'})"
         return f'{name}({call_args})'
     if kind == 'table':
         params = node[1]
         rn = params.get('rows', ('number', 0)); cn = params.get('cols', ('number', 0))
-        Re = emit_expression(rn); Ce = emit_expression(cn)
+        Re = emit_expression(rn, env); Ce = emit_expression(cn, env)
         if 'headers' in params:
-            H = emit_expression(params['headers'])
+            H = emit_expression(params['headers'], env)
             return f'Table(rows={Re},cols={Ce},headers={H})'
         return f'Table(rows={Re},cols={Ce})'
-    raise CodegenError(f'Cannot generate code for node: {kind}')(f'Unknown slice type: {sl[0]}')
+    raise CodegenError(f'Cannot generate code for node: {kind}')
 
-def emit_statement(node, indent=''):
+def emit_statement(node, indent='', env=None):
     kind = node[0]
     if kind == 'assign':
         n = node[1]
-        e = emit_expression(node[2])
+        e = emit_expression(node[2], env)
         return [f'{indent}{n}={e}']
     if kind == 'call':
         nm = node[1]
@@ -191,44 +173,83 @@ def emit_statement(node, indent=''):
         if nm == 'print':
             if len(args) == 1 and args[0][0] == 'var':
                 v = args[0][1]
+                vt = static_type(args[0], env)
+                if vt == TABLE:
+                    return [f"{indent}print('{v} =', {v}, sep='\\n')"]
+                if vt is not UNKNOWN:
+                    return [f"{indent}print('{v} =', {v})"]
                 return [f"{indent}print('{v} =', {v}) if not isinstance({v}, Table) else print('{v} =', {v}, sep='\\n')"]
-            ex = ', '.join(emit_expression(a) for a in args)
+            ex = ', '.join(emit_expression(a, env) for a in args)
             return [f'{indent}print({ex})']
-        return [f'{indent}{emit_expression(node)}']
+        return [f'{indent}{emit_expression(node, env)}']
     if kind == 'while':
-        cond = emit_expression(node[1])
+        cond = emit_expression(node[1], env)
         L = [f'{indent}while {cond}:']
-        L += emit_statement(node[2], indent + '    ')
+        L += emit_statement(node[2], indent + '    ', env) or [f'{indent}    pass']
         return L
     if kind == 'if':
-        cond = emit_expression(node[1])
+        cond = emit_expression(node[1], env)
         lines = [f'{indent}if {cond}:']
         for stmt in node[2][1]:
-            lines += emit_statement(stmt, indent + '    ')
+            lines += emit_statement(stmt, indent + '    ', env)
+        if len(lines) == 1:
+            lines.append(f'{indent}    pass')
         return lines
     if kind == 'block':
         out = []
         for s in node[1]:
-            out += emit_statement(s, indent)
+            out += emit_statement(s, indent, env)
         return out
     raise CodegenError(f'Cannot generate code for statement: {kind}')
 
-def generate_py(ast, out_path):
+def _read_source(name):
+    path = os.path.join(os.path.dirname(__file__), name)
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read().replace('\u2010', '-')
+
+def _runtime_helpers_src():
+    src = _read_source('wizuall_runtime.py')
+    start = src.index('# -- helpers')
+    end = src.index('# -- end helpers --')
+    return src[start:end].splitlines()[1:]
+
+def _used_runtime_names(lines):
+    # runtime names the generated body refers to, in EXPORTS order
+    words = set(re.findall(r'[A-Za-z_][A-Za-z0-9_]*', '\n'.join(lines)))
+    return [n for n in EXPORTS if n in words]
+
+def generate_py(ast, out_path, runtime='inline', workers=None, render_dir=None, render_format='png'):
     if ast[0] != 'program':
         raise CodegenError('AST root is not program')
-    base = os.path.dirname(__file__)
-    hp = os.path.join(base, 'wizual_helper.py')
-    vp = os.path.join(base, 'wizual_viz.py')
-    with open(hp, 'r', encoding='utf-8', errors='replace') as f:
-        helper_src = f.read().replace('\u2010', '-').splitlines()
-    with open(vp, 'r', encoding='utf-8', errors='replace') as f:
-        viz_src = f.read().replace('\u2010', '-').splitlines()
-    lines = helper_src + [''] + viz_src + ['', 'def main():']
+    ast = optimize(ast)
+    env = infer_types(ast)
+    stmts = []
     for stmt in ast[1]:
-        lines += emit_statement(stmt, '    ')
-    lines += ['', 'if __name__=="__main__":', '    main()']
+        stmts += emit_statement(stmt, '    ', env)
+    body = ['', 'def main():']
+    if workers:
+        body.append(f'    set_workers({int(workers)})')
+    if any(n in VIZ_FUNCTIONS for n in _used_runtime_names(stmts)):
+        # queued charts are waited for before main() returns, so a failed
+        # render raises here and the script exits non-zero
+        if render_dir:
+            body.append(f'    set_render_dir({render_dir!r}, {render_format!r})')
+        body += ['    try:'] + ['    ' + line for line in stmts] + ['    finally:', '        flush()']
+    else:
+        body += stmts or ['    pass']
+    body += ['', 'if __name__=="__main__":', '    main()']
+    used = _used_runtime_names(body)
+    if runtime == 'package':
+        lines = [f"from wizuall_runtime import {', '.join(used)}"] if used else []
+    elif runtime == 'inline':
+        lines = _read_source('wizual_helper.py').splitlines() + _runtime_helpers_src()
+        if any(n in VIZ_FUNCTIONS for n in used):
+            lines += [''] + _read_source('wizual_viz.py').splitlines()
+    else:
+        raise CodegenError(f"Unknown runtime mode '{runtime}' (expected 'inline' or 'package')")
+    lines += body
     dp = os.path.dirname(out_path)
     if dp:
         os.makedirs(dp, exist_ok=True)
     with open(out_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
\ No newline at end of file
+        f.write('\n'.join(lines))
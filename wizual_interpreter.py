@@ -1,9 +1,73 @@
-from wizual_parser import parser
-from wizual_helper import Table, read_csv
+import operator
+from wizual_parser import parse
+from wizual_optimizer import optimize
+from wizual_helper import Table, matmul, SEQUENCE_TYPES
+from wizual_builtins import BUILTINS
 
 class EvalError(Exception):
     pass
 
+def apply_binop(op, a, b):
+    if isinstance(a, Table) or isinstance(b, Table):
+        if op == '+': return a + b
+        if op == '-': return a - b
+        if op == '*': return a * b
+        if op == '/': return a / b
+        if op == '%': return a % b
+        if op == '@': return matmul(a, b) if isinstance(a, Table) and isinstance(b, Table) else a @ b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        if op == '+': return a + b
+        if op == '-': return a - b
+        if op == '*': return a * b
+        if op == '/': return a / b
+    if isinstance(a, SEQUENCE_TYPES) and isinstance(b, SEQUENCE_TYPES):
+        if len(a) != len(b):
+            raise EvalError("Cannot perform element-wise on lists of different lengths")
+        if op == '+': return [a[i] + b[i] for i in range(len(a))]
+        if op == '-': return [a[i] - b[i] for i in range(len(a))]
+        if op == '*': return [a[i] * b[i] for i in range(len(a))]
+        if op == '/': return [a[i] / b[i] for i in range(len(a))]
+    if isinstance(a, SEQUENCE_TYPES) and isinstance(b, (int, float)):
+        if op == '+': return [x + b for x in a]
+        if op == '-': return [x - b for x in a]
+        if op == '*': return [x * b for x in a]
+        if op == '/': return [x / b for x in a]
+    if isinstance(b, SEQUENCE_TYPES) and isinstance(a, (int, float)):
+        if op == '+': return [a + x for x in b]
+        if op == '-': return [a - x for x in b]
+        if op == '*': return [a * x for x in b]
+        if op == '/': return [a / x for x in b]
+    raise EvalError(f"Unsupported operand types for '{op}': {type(a)} and {type(b)}")
+
+def apply_slice(base, sl):
+    if isinstance(base, SEQUENCE_TYPES) and sl[0] in ("index", "range"):
+        if sl[0] == "index":
+            return base[sl[1]]
+        data = base[sl[1]:sl[2]]
+        return data
+    if isinstance(base, Table):
+        if sl[0] == "index":
+            return base.data[sl[1]]
+        if sl[0] == "column":
+            return base.get_col_by_name(sl[1])
+        if sl[0] == "columns":
+            return base.col_range(sl[1], sl[2])
+        return base.slice_rows(sl[1], sl[2])
+    if sl[0] in ("column", "columns"):
+        raise TypeError("Only tables can be sliced by column name")
+    raise TypeError("Cannot slice non-indexable type")
+
+def copy_const(value):
+    # folded list constants are shared by the AST, so every evaluation hands
+    # out a fresh copy, as evaluating the original list literal did
+    return [copy_const(v) for v in value] if isinstance(value, list) else value
+
+def call_builtin(name, args, sym):
+    builtin = BUILTINS.get(name)
+    if builtin is None:
+        raise NameError(f"Unknown function '{name}'")
+    return builtin(args, sym)
+
 def evaluate(node, sym):
     kind = node[0]
     if kind == "program":
@@ -15,42 +79,13 @@ def evaluate(node, sym):
         return sym[name]
     elif kind == "binop":
         op, left_n, right_n = node[1], node[2], node[3]
-        a = evaluate(left_n, sym)
-        b = evaluate(right_n, sym)
-        if isinstance(a, Table) or isinstance(b, Table):
-            if op == '+': return a + b
-            if op == '-': return a - b
-            if op == '*': return a * b
-            if op == '/': return a / b
-            if op == '%': return a % b
-            if op == '@': return a @ b
-        if isinstance(a, (int, float)) and isinstance(b, (int, float)):
-            if op == '+': return a + b
-            if op == '-': return a - b
-            if op == '*': return a * b
-            if op == '/': return a / b
-        if isinstance(a, list) and isinstance(b, list):
-            if len(a) != len(b):
-                raise EvalError("Cannot perform element-wise on lists of different lengths")
-            if op == '+': return [a[i] + b[i] for i in range(len(a))]
-            if op == '-': return [a[i] - b[i] for i in range(len(a))]
-            if op == '*': return [a[i] * b[i] for i in range(len(a))]
-            if op == '/': return [a[i] / b[i] for i in range(len(a))]
-        if isinstance(a, list) and isinstance(b, (int, float)):
-            if op == '+': return [x + b for x in a]
-            if op == '-': return [x - b for x in a]
-            if op == '*': return [x * b for x in a]
-            if op == '/': return [x / b for x in a]
-        if isinstance(b, list) and isinstance(a, (int, float)):
-            if op == '+': return [a + x for x in b]
-            if op == '-': return [a - x for x in b]
-            if op == '*': return [a * x for x in b]
-            if op == '/': return [a / x for x in b]
-        raise EvalError(f"Unsupported operand types for '{op}': {type(a)} and {type(b)}")
+        return apply_binop(op, evaluate(left_n, sym), evaluate(right_n, sym))
     elif kind == "number":
         return node[1]
     elif kind == "string":
         return node[1]
+    elif kind == "const":
+        return copy_const(node[1])
     elif kind == "var":
         name = node[1]
         if name not in sym:
@@ -59,19 +94,7 @@ def evaluate(node, sym):
     elif kind == "list":
         return [evaluate(elem, sym) for elem in node[1]]
     elif kind == "slice":
-        base_n, sl = node[1], node[2]
-        base = evaluate(base_n, sym)
-        if isinstance(base, list):
-            if sl[0] == "index":
-                return base[sl[1]]
-            data = base[sl[1]:sl[2]]
-            return data
-        if isinstance(base, Table):
-            if sl[0] == "index":
-                return base.data[sl[1]]
-            rows = base.data[sl[1]:sl[2]]
-            return Table(rows=len(rows), cols=base.cols, headers=base.headers, data=rows)
-        raise TypeError("Cannot slice non-indexable type")
+        return apply_slice(evaluate(node[1], sym), node[2])
     elif kind == "while":
         cond_n, block_n = node[1], node[2]
         while evaluate(cond_n, sym):
@@ -97,68 +120,136 @@ def evaluate(node, sym):
     elif kind == "table":
         params = node[1]
         rows = 0
-        cols = evaluate(params.get("cols", 0), sym)
+        cols = evaluate(params.get("cols", ("number", 0)), sym)
         headers = (evaluate(params["headers"], sym)
                    if "headers" in params else [str(i) for i in range(cols)])
         return Table(rows=rows, cols=cols, headers=headers)
     elif kind == "call":
         name, args_n = node[1], node[2]
-        args = [evaluate(a, sym) for a in args_n]
-        builtins = {
-            "sum":    lambda a: sum(a[0]) if isinstance(a[0], list) else None,
-            "avg":    lambda a: sum(a[0]) / len(a[0]),
-            "min":    lambda a: min(a[0]),
-            "max":    lambda a: max(a[0]),
-            "sort":   lambda a: sorted(a[0]),
-            "reverse":lambda a: list(reversed(a[0])),
-            "getRow": lambda a: a[0].data[a[1]],
-            "getCol": lambda a: [r[a[1]] for r in a[0].data],
-            "py":     lambda a: eval(a[0], globals(), sym),
-            "appendRow":   lambda a: a[0].append_row(a[1]),
-            "updateCell":  lambda a: a[0].update_cell(a[1], a[2], a[3]),
-            "cols":        lambda a: Table(rows=a[0].rows, cols=len(a[1]), headers=a[1],
-                                           data=[[row[a[0].headers.index(c)] for c in a[1]]
-                                                 for row in a[0].data]),
-            "sumTable":    lambda a: a[0].sum_table(),
-            "sumRows":     lambda a: a[0].sum_rows(),
-            "sumCols":     lambda a: a[0].sum_cols(),
-            "avgTable":    lambda a: a[0].avg_table(),
-            "avgRows":     lambda a: a[0].avg_rows(),
-            "avgCols":     lambda a: a[0].avg_cols(),
-            "varTable":    lambda a: a[0].var_table(),
-            "stdevTable":  lambda a: a[0].stdev_table(),
-            "varRows":     lambda a: a[0].var_rows(),
-            "stdevRows":   lambda a: a[0].stdev_rows(),
-            "varCols":     lambda a: a[0].var_cols(),
-            "stdevCols":   lambda a: a[0].stdev_cols(),
-            "minTable":    lambda a: a[0].min_table(),
-            "maxTable":    lambda a: a[0].max_table(),
-            "minRows":     lambda a: a[0].min_rows(),
-            "maxRows":     lambda a: a[0].max_rows(),
-            "minCols":     lambda a: a[0].min_cols(),
-            "maxCols":     lambda a: a[0].max_cols(),
-            "plotHeatmap": lambda a: __import__('wizual_viz').wizual_viz.plot_table_heatmap(a[0]),
-            "barChart":    lambda a: __import__('wizual_viz').wizual_viz.bar_chart(a[0], a[1], a[2] if len(a)>2 else None),
-            "lineChart":   lambda a: __import__('wizual_viz').wizual_viz.line_chart(a[0], a[1], a[2] if len(a)>2 else None),
-            "scatterPlot": lambda a: __import__('wizual_viz').wizual_viz.scatter_plot(a[0], a[1], a[2] if len(a)>2 else None),
-            "histogram":   lambda a: __import__('wizual_viz').wizual_viz.histogram(a[0], a[1] if len(a)>1 else 10, a[2] if len(a)>2 else None),
-            "plotTable":   lambda a: __import__('wizual_viz').wizual_viz.plot_table(a[0]) if isinstance(a[0], Table) else None,
-            "readCSV":     lambda a: read_csv(a[0]),
-            "lineChartTable": lambda a: __import__('wizual_viz').line_chart_table(a[0]) if isinstance(a[0], Table) else None,
-        }
-        if name == "print":
-            for a in args_n:
-                val = evaluate(a, sym)
-                print(val)
-            return None
-        if name not in builtins:
-            raise NameError(f"Unknown function '{name}'")
-        return builtins[name](args)
+        return call_builtin(name, [evaluate(a, sym) for a in args_n], sym)
     else:
         raise EvalError(f"Unknown AST node '{kind}'")
 
+# Closure compiler: turns the parser's tuple AST into nested Python callables
+# once, so loops re-run prepared closures instead of re-dispatching on node[0].
+# Every closure takes the symbol table and behaves exactly like evaluate().
+
+_ARITH = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+_COMPARE = {'==': operator.eq, '!=': operator.ne, '<': operator.lt,
+            '>': operator.gt, '<=': operator.le, '>=': operator.ge}
+_SCALARS = (int, float)
+
+def _compile_seq(stmts):
+    fns = tuple(compile_node(s) for s in stmts)
+    def run_seq(sym):
+        for fn in fns:
+            fn(sym)
+    return run_seq
+
+def _compile_binop(node):
+    op, left, right = node[1], compile_node(node[2]), compile_node(node[3])
+    fn = _ARITH.get(op)
+    if fn is None:
+        def run_binop(sym):
+            return apply_binop(op, left(sym), right(sym))
+        return run_binop
+    def run_arith(sym):
+        a = left(sym)
+        b = right(sym)
+        if a.__class__ in _SCALARS and b.__class__ in _SCALARS:
+            return fn(a, b)
+        return apply_binop(op, a, b)
+    return run_arith
+
+def _compile_call(node):
+    name = node[1]
+    args = tuple(compile_node(a) for a in node[2])
+    def run_call(sym):
+        return call_builtin(name, [a(sym) for a in args], sym)
+    return run_call
+
+def _compile_table(node):
+    params = node[1]
+    cols = compile_node(params.get("cols", ("number", 0)))
+    headers = compile_node(params["headers"]) if "headers" in params else None
+    def run_table(sym):
+        c = cols(sym)
+        h = headers(sym) if headers else [str(i) for i in range(c)]
+        return Table(rows=0, cols=c, headers=h)
+    return run_table
+
+def compile_node(node):
+    kind = node[0]
+    if kind in ("program", "block"):
+        return _compile_seq(node[1])
+    if kind == "assign":
+        name, expr = node[1], compile_node(node[2])
+        def run_assign(sym):
+            sym[name] = value = expr(sym)
+            return value
+        return run_assign
+    if kind == "binop":
+        return _compile_binop(node)
+    if kind in ("number", "string"):
+        value = node[1]
+        return lambda sym: value
+    if kind == "const":
+        value = node[1]
+        if not isinstance(value, list):
+            return lambda sym: value
+        if any(isinstance(v, list) for v in value):
+            return lambda sym: copy_const(value)
+        return lambda sym: value[:]
+    if kind == "var":
+        name = node[1]
+        def run_var(sym):
+            try:
+                return sym[name]
+            except KeyError:
+                raise NameError(f"Undefined variable '{name}'") from None
+        return run_var
+    if kind == "list":
+        elems = tuple(compile_node(e) for e in node[1])
+        return lambda sym: [e(sym) for e in elems]
+    if kind == "slice":
+        base, sl = compile_node(node[1]), node[2]
+        return lambda sym: apply_slice(base(sym), sl)
+    if kind == "while":
+        cond, body = compile_node(node[1]), compile_node(node[2])
+        def run_while(sym):
+            while cond(sym):
+                body(sym)
+        return run_while
+    if kind == "if":
+        cond, body = compile_node(node[1]), compile_node(node[2])
+        def run_if(sym):
+            if cond(sym):
+                body(sym)
+        return run_if
+    if kind == "bool":
+        op = node[1]
+        if op not in _COMPARE:
+            raise EvalError(f"Unknown boolean operator '{op}'")
+        fn, left, right = _COMPARE[op], compile_node(node[2]), compile_node(node[3])
+        return lambda sym: fn(left(sym), right(sym))
+    if kind == "table":
+        return _compile_table(node)
+    if kind == "call":
+        return _compile_call(node)
+    raise EvalError(f"Unknown AST node '{kind}'")
+
+class Session:
+    # One symbol table kept alive across executions, so an interactive user
+    # can build on earlier statements (and loaded tables stay resident).
+    def __init__(self, sym=None):
+        self.sym = {} if sym is None else sym
+
+    def execute(self, code):
+        return self.execute_ast(parse(code))
+
+    def execute_ast(self, ast):
+        compile_node(optimize(ast))(self.sym)
+        return self.sym
+
 def run(input_code):
-    ast = parser.parse(input_code)
-    symtable = {}
-    evaluate(ast, symtable)
-    return symtable
+    return Session().execute(input_code)
@@ -1,3 +1,5 @@
+import hashlib
+import os
 import ply.lex as lex
 
 class LexError(Exception):
@@ -62,4 +64,31 @@ def t_newline(t):
 def t_error(t):
     raise LexError(f"Illegal character '{t.value[0]}' at line {t.lexer.lineno}")
 
-lexer = lex.lex()
\ No newline at end of file
+# The master regexes are cached in wizual_lextab (shipped with the package)
+# and loaded in PLY's optimized mode, which skips rule validation. The table
+# carries a hash of the token rules and is rebuilt only when they change.
+LEXTAB = 'wizual_lextab'
+_TABDIR = os.path.dirname(os.path.abspath(__file__))
+
+def rules_signature():
+    rules = [(k, v if isinstance(v, str) else v.__doc__)
+             for k, v in sorted(globals().items()) if k.startswith('t_')]
+    return hashlib.sha256(repr((tokens, sorted(reserved.items()), rules)).encode()).hexdigest()
+
+def build_lexer():
+    sig = rules_signature()
+    try:
+        tab = __import__(LEXTAB)
+        fresh = getattr(tab, '_signature', None) == sig
+    except ImportError:
+        fresh = False
+    if fresh:
+        return lex.lex(optimize=True, lextab=LEXTAB)
+    lexobj = lex.lex()
+    if os.access(_TABDIR, os.W_OK):
+        lexobj.writetab(LEXTAB, _TABDIR)
+        with open(os.path.join(_TABDIR, LEXTAB + '.py'), 'a') as f:
+            f.write(f"_signature = {sig!r}\n")
+    return lexobj
+
+lexer = build_lexer()
\ No newline at end of file
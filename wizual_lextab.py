@@ -0,0 +1,11 @@
+# wizual_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASSIGN', 'AT', 'COLON', 'COMMA', 'DIVIDE', 'EQ', 'GE', 'GT', 'IDENTIFIER', 'IF', 'LBRACE', 'LBRACKET', 'LE', 'LPAREN', 'LT', 'MINUS', 'MOD', 'NE', 'NUMBER', 'PLUS', 'RBRACE', 'RBRACKET', 'RPAREN', 'SEMICOLON', 'STRING', 'TABLE', 'TIMES', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_STRING>"[^"]*")|(?P<t_NUMBER>\\d+(\\.\\d+)?)|(?P<t_IDENTIFIER>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_newline>\\n+)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_EQ>==)|(?P<t_NE>!=)|(?P<t_LE><=)|(?P<t_GE>>=)|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_MOD>%)|(?P<t_AT>@)|(?P<t_ASSIGN>=)|(?P<t_SEMICOLON>;)|(?P<t_COMMA>,)|(?P<t_COLON>:)|(?P<t_LT><)|(?P<t_GT>>)', [None, ('t_STRING', 'STRING'), ('t_NUMBER', 'NUMBER'), None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_newline', 'newline'), (None, 'PLUS'), (None, 'TIMES'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'EQ'), (None, 'NE'), (None, 'LE'), (None, 'GE'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'MOD'), (None, 'AT'), (None, 'ASSIGN'), (None, 'SEMICOLON'), (None, 'COMMA'), (None, 'COLON'), (None, 'LT'), (None, 'GT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_signature = 'c494eadbda2bfb5fbf515640652255dd5919ca54a1b6fafb5469811bc76ba206'
@@ -0,0 +1,146 @@
+import math
+import operator
+
+# AST optimizer run between parsing and execution or code generation.
+# Constant arithmetic and comparisons fold to ('number', v) / ('string', s);
+# list literals whose elements are all constant, and element-wise arithmetic
+# or literal slices of them, fold to ('const', list); a constant condition
+# becomes ('const', True/False), and if/while statements that can never run
+# are dropped (an always-true if is replaced by its block). Anything that
+# would raise at run time (division by zero, length mismatch, unsupported
+# operand types) is left alone so the error still happens where it did.
+
+_ARITH = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+_COMPARE = {'==': operator.eq, '!=': operator.ne, '<': operator.lt,
+            '>': operator.gt, '<=': operator.le, '>=': operator.ge}
+_NO_VALUE = object()
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+def _value(node):
+    # the Python value of a constant node, or _NO_VALUE
+    if node[0] in ('number', 'string', 'const'):
+        return node[1]
+    return _NO_VALUE
+
+def _node(value):
+    if _is_number(value):
+        return ('number', value)
+    if isinstance(value, str):
+        return ('string', value)
+    return ('const', value)
+
+def _arith(fn, a, b):
+    if not (_is_number(a) and _is_number(b)) or (fn is operator.truediv and b == 0):
+        return _NO_VALUE
+    v = fn(a, b)
+    return v if not isinstance(v, float) or math.isfinite(v) else _NO_VALUE
+
+def _fold_binop(op, a, b):
+    fn = _ARITH.get(op)
+    if fn is None:
+        return _NO_VALUE
+    if isinstance(a, list) and isinstance(b, list):
+        if len(a) != len(b):
+            return _NO_VALUE
+        out = [_arith(fn, x, y) for x, y in zip(a, b)]
+    elif isinstance(a, list):
+        out = [_arith(fn, x, b) for x in a] if _is_number(b) else [_NO_VALUE]
+    elif isinstance(b, list):
+        out = [_arith(fn, a, y) for y in b] if _is_number(a) else [_NO_VALUE]
+    else:
+        return _arith(fn, a, b)
+    return _NO_VALUE if _NO_VALUE in out else out
+
+def _fold_compare(op, a, b):
+    fn = _COMPARE.get(op)
+    if fn is None or isinstance(a, list) or isinstance(b, list) or isinstance(a, bool) or isinstance(b, bool):
+        return _NO_VALUE
+    if op not in ('==', '!=') and not ((_is_number(a) and _is_number(b)) or
+                                       (isinstance(a, str) and isinstance(b, str))):
+        return _NO_VALUE
+    return fn(a, b)
+
+def _fold_slice(base, sl):
+    # bounds that are not plain ints (e.g. [1,2][0.5]) are left for run time
+    if not isinstance(base, list) or not all(isinstance(b, int) and not isinstance(b, bool) for b in sl[1:]):
+        return _NO_VALUE
+    if sl[0] == 'index':
+        return base[sl[1]] if 0 <= sl[1] < len(base) else _NO_VALUE
+    if sl[0] == 'range':
+        return base[sl[1]:sl[2]]
+    return _NO_VALUE
+
+def _expr(node, stats):
+    kind = node[0]
+    if kind == 'binop':
+        left, right = _expr(node[2], stats), _expr(node[3], stats)
+        v = _fold_binop(node[1], _value(left), _value(right)) \
+            if _NO_VALUE not in (_value(left), _value(right)) else _NO_VALUE
+        if v is not _NO_VALUE:
+            stats['folded'] += 1
+            return _node(v)
+        return (kind, node[1], left, right)
+    if kind == 'bool':
+        left, right = _expr(node[2], stats), _expr(node[3], stats)
+        v = _fold_compare(node[1], _value(left), _value(right)) \
+            if _NO_VALUE not in (_value(left), _value(right)) else _NO_VALUE
+        if v is not _NO_VALUE:
+            stats['folded'] += 1
+            return ('const', v)
+        return (kind, node[1], left, right)
+    if kind == 'list':
+        elems = [_expr(e, stats) for e in node[1]]
+        values = [_value(e) for e in elems]
+        if _NO_VALUE not in values:
+            stats['folded'] += 1
+            return ('const', values)
+        return (kind, elems)
+    if kind == 'slice':
+        base = _expr(node[1], stats)
+        v = _fold_slice(_value(base), node[2])
+        if v is not _NO_VALUE:
+            stats['folded'] += 1
+            return _node(v)
+        return (kind, base, node[2])
+    if kind == 'call':
+        return (kind, node[1], [_expr(a, stats) for a in node[2]])
+    if kind == 'table':
+        return (kind, {k: _expr(v, stats) for k, v in node[1].items()})
+    return node
+
+def _stmts(stmts, stats):
+    out = []
+    for stmt in stmts:
+        out += _stmt(stmt, stats)
+    return out
+
+def _stmt(node, stats):
+    # returns the list of statements that replace node
+    kind = node[0]
+    if kind == 'assign':
+        return [(kind, node[1], _expr(node[2], stats))]
+    if kind in ('if', 'while'):
+        cond = _expr(node[1], stats)
+        if _value(cond) is False:
+            stats['pruned'] += 1
+            return []
+        body = ('block', _stmts(node[2][1], stats))
+        if kind == 'if' and _value(cond) is True:
+            stats['pruned'] += 1
+            return [body]
+        return [(kind, cond, body)]
+    if kind == 'block':
+        return [(kind, _stmts(node[1], stats))]
+    return [_expr(node, stats)]
+
+def optimize(ast, stats=None):
+    # stats, if given, receives counts of 'folded' expressions and 'pruned'
+    # branches
+    stats = stats if stats is not None else {}
+    stats.setdefault('folded', 0)
+    stats.setdefault('pruned', 0)
+    if ast[0] != 'program':
+        return ast
+    return ('program', _stmts(ast[1], stats))
@@ -1,5 +1,7 @@
+import hashlib
+import os
 import ply.yacc as yacc
-from wizual_lexer import tokens
+from wizual_lexer import tokens, lexer
 
 precedence = (
     ('left', 'PLUS', 'MINUS'),
@@ -102,6 +104,14 @@ def p_range_expr_single(p):
     'range_expr : NUMBER'
     p[0] = ("index", p[1])
 
+def p_range_expr_column(p):
+    'range_expr : STRING'
+    p[0] = ("column", p[1])
+
+def p_range_expr_columns(p):
+    'range_expr : STRING COLON STRING'
+    p[0] = ("columns", p[1], p[3])
+
 def p_primary_expr_func_call(p):
     'primary_expr : IDENTIFIER LPAREN arg_list RPAREN'
     p[0] = ("call", p[1], p[3])
@@ -178,4 +188,21 @@ def p_error(p):
     else:
         raise SyntaxError("Unexpected end of input")
 
-parser = yacc.yacc()
\ No newline at end of file
+# LALR tables live in wizual_parsetab, shipped with the package. PLY compares
+# the grammar signature stored there with the p_* rules and only rebuilds the
+# tables when the grammar has changed; parser.out is never written, and a
+# read-only install simply builds in memory.
+PARSETAB = 'wizual_parsetab'
+_TABDIR = os.path.dirname(os.path.abspath(__file__))
+
+parser = yacc.yacc(debug=False, tabmodule=PARSETAB, outputdir=_TABDIR,
+                   write_tables=os.access(_TABDIR, os.W_OK))
+
+
+def grammar_signature():
+    rules = [(k, v.__doc__) for k, v in sorted(globals().items()) if k.startswith('p_')]
+    return hashlib.sha256(repr((precedence, rules)).encode()).hexdigest()
+
+def parse(code):
+    lexer.lineno = 1
+    return parser.parse(code, lexer=lexer)
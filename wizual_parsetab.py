@@ -0,0 +1,82 @@
+
+# wizual_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftPLUSMINUSleftTIMESDIVIDEMODATASSIGN AT COLON COMMA DIVIDE EQ GE GT IDENTIFIER IF LBRACE LBRACKET LE LPAREN LT MINUS MOD NE NUMBER PLUS RBRACE RBRACKET RPAREN SEMICOLON STRING TABLE TIMES WHILEprogram : statement_liststatement_list : statement_list statementstatement_list : statementstatement : assignment_stmt\n                 | void_function_call_stmt\n                 | while_stmt\n                 | if_stmtvoid_function_call_stmt : expression SEMICOLONassignment_stmt : IDENTIFIER ASSIGN expression SEMICOLONwhile_stmt : WHILE LPAREN bool_expr RPAREN blockif_stmt : IF LPAREN bool_expr RPAREN blockblock : LBRACE statement_list RBRACEbool_expr : expression EQ expression\n                 | expression NE expression\n                 | expression LT expression\n                 | expression GT expression\n                 | expression LE expression\n                 | expression GE expressionexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | expression MOD expression\n                  | expression AT expressionexpression : postfix_exprpostfix_expr : primary_expr slice_list_optslice_list_opt :slice_list_opt : slice_listslice_list : sliceslice_list : slice_list sliceslice : LBRACKET range_expr RBRACKETrange_expr : NUMBER COLON NUMBERrange_expr : NUMBERrange_expr : STRINGrange_expr : STRING COLON STRINGprimary_expr : IDENTIFIER LPAREN arg_list RPARENprimary_expr : NUMBERprimary_expr : IDENTIFIERprimary_expr : STRINGprimary_expr : LPAREN expression RPARENprimary_expr : list_literalprimary_expr : table_literallist_literal : LBRACKET expression_list RBRACKETlist_literal : LBRACKET RBRACKETexpression_list : expression_list COMMA expressionexpression_list : expressiontable_literal : TABLE LPAREN table_params RPARENtable_params : table_params COMMA table_paramtable_params : table_paramtable_param : IDENTIFIER ASSIGN expressionarg_list :arg_list : expression_list'
+    
+_lr_action_items = {'IDENTIFIER':([0,2,3,4,5,6,7,11,19,21,22,23,24,25,26,27,28,29,30,31,34,42,61,65,68,69,70,71,72,73,80,81,82,83,90,95,96,],[8,8,-3,-4,-5,-6,-7,33,33,-2,33,33,-8,33,33,33,33,33,33,33,33,64,33,-9,33,33,33,33,33,33,64,33,-10,8,-11,8,-12,]),'WHILE':([0,2,3,4,5,6,7,21,24,65,82,83,90,95,96,],[10,10,-3,-4,-5,-6,-7,-2,-8,-9,-10,10,-11,10,-12,]),'IF':([0,2,3,4,5,6,7,21,24,65,82,83,90,95,96,],[12,12,-3,-4,-5,-6,-7,-2,-8,-9,-10,12,-11,12,-12,]),'NUMBER':([0,2,3,4,5,6,7,11,19,21,22,23,24,25,26,27,28,29,30,31,34,38,61,65,68,69,70,71,72,73,76,81,82,83,90,95,96,],[15,15,-3,-4,-5,-6,-7,15,15,-2,15,15,-8,15,15,15,15,15,15,15,15,58,15,-9,15,15,15,15,15,15,91,15,-10,15,-11,15,-12,]),'STRING':([0,2,3,4,5,6,7,11,19,21,22,23,24,25,26,27,28,29,30,31,34,38,61,65,68,69,70,71,72,73,77,81,82,83,90,95,96,],[16,16,-3,-4,-5,-6,-7,16,16,-2,16,16,-8,16,16,16,16,16,16,16,16,59,16,-9,16,16,16,16,16,16,92,16,-10,16,-11,16,-12,]),'LPAREN':([0,2,3,4,5,6,7,8,10,11,12,19,20,21,22,23,24,25,26,27,28,29,30,31,33,34,61,65,68,69,70,71,72,73,81,82,83,90,95,96,],[11,11,-3,-4,-5,-6,-7,23,31,11,34,11,42,-2,11,11,-8,11,11,11,11,11,11,11,23,11,11,-9,11,11,11,11,11,11,11,-10,11,-11,11,-12,]),'LBRACKET':([0,2,3,4,5,6,7,8,11,14,15,16,17,18,19,21,22,23,24,25,26,27,28,29,30,31,33,34,36,37,40,54,56,60,61,65,66,68,69,70,71,72,73,75,79,81,82,83,90,95,96,],[19,19,-3,-4,-5,-6,-7,-38,19,38,-37,-39,-41,-42,19,-2,19,19,-8,19,19,19,19,19,19,19,-38,19,38,-29,-44,-40,-30,-43,19,-9,-36,19,19,19,19,19,19,-31,-47,19,-10,19,-11,19,-12,]),'TABLE':([0,2,3,4,5,6,7,11,19,21,22,23,24,25,26,27,28,29,30,31,34,61,65,68,69,70,71,72,73,81,82,83,90,95,96,],[20,20,-3,-4,-5,-6,-7,20,20,-2,20,20,-8,20,20,20,20,20,20,20,20,20,-9,20,20,20,20,20,20,20,-10,20,-11,20,-12,]),'$end':([1,2,3,4,5,6,7,21,24,65,82,90,96,],[0,-1,-3,-4,-5,-6,-7,-2,-8,-9,-10,-11,-12,]),'RBRACE':([3,4,5,6,7,21,24,65,82,90,95,96,],[-3,-4,-5,-6,-7,-2,-8,-9,-10,-11,96,-12,]),'ASSIGN':([8,64,],[22,81,]),'SEMICOLON':([8,9,13,14,15,16,17,18,33,35,36,37,40,43,46,47,48,49,50,51,54,56,60,66,75,79,],[-38,24,-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,-44,65,-19,-20,-21,-22,-23,-24,-40,-30,-43,-36,-31,-47,]),'PLUS':([8,9,13,14,15,16,17,18,32,33,35,36,37,40,41,43,46,47,48,49,50,51,53,54,56,60,66,75,78,79,84,85,86,87,88,89,94,],[-38,25,-25,-27,-37,-39,-41,-42,25,-38,-26,-28,-29,-44,25,25,-19,-20,-21,-22,-23,-24,25,-40,-30,-43,-36,-31,25,-47,25,25,25,25,25,25,25,]),'MINUS':([8,9,13,14,15,16,17,18,32,33,35,36,37,40,41,43,46,47,48,49,50,51,53,54,56,60,66,75,78,79,84,85,86,87,88,89,94,],[-38,26,-25,-27,-37,-39,-41,-42,26,-38,-26,-28,-29,-44,26,26,-19,-20,-21,-22,-23,-24,26,-40,-30,-43,-36,-31,26,-47,26,26,26,26,26,26,26,]),'TIMES':([8,9,13,14,15,16,17,18,32,33,35,36,37,40,41,43,46,47,48,49,50,51,53,54,56,60,66,75,78,79,84,85,86,87,88,89,94,],[-38,27,-25,-27,-37,-39,-41,-42,27,-38,-26,-28,-29,-44,27,27,27,27,-21,-22,-23,-24,27,-40,-30,-43,-36,-31,27,-47,27,27,27,27,27,27,27,]),'DIVIDE':([8,9,13,14,15,16,17,18,32,33,35,36,37,40,41,43,46,47,48,49,50,51,53,54,56,60,66,75,78,79,84,85,86,87,88,89,94,],[-38,28,-25,-27,-37,-39,-41,-42,28,-38,-26,-28,-29,-44,28,28,28,28,-21,-22,-23,-24,28,-40,-30,-43,-36,-31,28,-47,28,28,28,28,28,28,28,]),'MOD':([8,9,13,14,15,16,17,18,32,33,35,36,37,40,41,43,46,47,48,49,50,51,53,54,56,60,66,75,78,79,84,85,86,87,88,89,94,],[-38,29,-25,-27,-37,-39,-41,-42,29,-38,-26,-28,-29,-44,29,29,29,29,-21,-22,-23,-24,29,-40,-30,-43,-36,-31,29,-47,29,29,29,29,29,29,29,]),'AT':([8,9,13,14,15,16,17,18,32,33,35,36,37,40,41,43,46,47,48,49,50,51,53,54,56,60,66,75,78,79,84,85,86,87,88,89,94,],[-38,30,-25,-27,-37,-39,-41,-42,30,-38,-26,-28,-29,-44,30,30,30,30,-21,-22,-23,-24,30,-40,-30,-43,-36,-31,30,-47,30,30,30,30,30,30,30,]),'RPAREN':([13,14,15,16,17,18,23,32,33,35,36,37,40,41,44,45,46,47,48,49,50,51,52,54,55,56,60,62,63,66,75,78,79,84,85,86,87,88,89,93,94,],[-25,-27,-37,-39,-41,-42,-51,54,-38,-26,-28,-29,-44,-46,66,-52,-19,-20,-21,-22,-23,-24,67,-40,74,-30,-43,79,-49,-36,-31,-45,-47,-13,-14,-15,-16,-17,-18,-48,-50,]),'RBRACKET':([13,14,15,16,17,18,19,33,35,36,37,39,40,41,46,47,48,49,50,51,54,56,57,58,59,60,66,75,78,79,91,92,],[-25,-27,-37,-39,-41,-42,40,-38,-26,-28,-29,60,-44,-46,-19,-20,-21,-22,-23,-24,-40,-30,75,-33,-34,-43,-36,-31,-45,-47,-32,-35,]),'COMMA':([13,14,15,16,17,18,33,35,36,37,39,40,41,45,46,47,48,49,50,51,54,56,60,62,63,66,75,78,79,93,94,],[-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,61,-44,-46,61,-19,-20,-21,-22,-23,-24,-40,-30,-43,80,-49,-36,-31,-45,-47,-48,-50,]),'EQ':([13,14,15,16,17,18,33,35,36,37,40,46,47,48,49,50,51,53,54,56,60,66,75,79,],[-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,-44,-19,-20,-21,-22,-23,-24,68,-40,-30,-43,-36,-31,-47,]),'NE':([13,14,15,16,17,18,33,35,36,37,40,46,47,48,49,50,51,53,54,56,60,66,75,79,],[-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,-44,-19,-20,-21,-22,-23,-24,69,-40,-30,-43,-36,-31,-47,]),'LT':([13,14,15,16,17,18,33,35,36,37,40,46,47,48,49,50,51,53,54,56,60,66,75,79,],[-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,-44,-19,-20,-21,-22,-23,-24,70,-40,-30,-43,-36,-31,-47,]),'GT':([13,14,15,16,17,18,33,35,36,37,40,46,47,48,49,50,51,53,54,56,60,66,75,79,],[-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,-44,-19,-20,-21,-22,-23,-24,71,-40,-30,-43,-36,-31,-47,]),'LE':([13,14,15,16,17,18,33,35,36,37,40,46,47,48,49,50,51,53,54,56,60,66,75,79,],[-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,-44,-19,-20,-21,-22,-23,-24,72,-40,-30,-43,-36,-31,-47,]),'GE':([13,14,15,16,17,18,33,35,36,37,40,46,47,48,49,50,51,53,54,56,60,66,75,79,],[-25,-27,-37,-39,-41,-42,-38,-26,-28,-29,-44,-19,-20,-21,-22,-23,-24,73,-40,-30,-43,-36,-31,-47,]),'COLON':([58,59,],[76,77,]),'LBRACE':([67,74,],[83,83,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,83,],[2,95,]),'statement':([0,2,83,95,],[3,21,3,21,]),'assignment_stmt':([0,2,83,95,],[4,4,4,4,]),'void_function_call_stmt':([0,2,83,95,],[5,5,5,5,]),'while_stmt':([0,2,83,95,],[6,6,6,6,]),'if_stmt':([0,2,83,95,],[7,7,7,7,]),'expression':([0,2,11,19,22,23,25,26,27,28,29,30,31,34,61,68,69,70,71,72,73,81,83,95,],[9,9,32,41,43,41,46,47,48,49,50,51,53,53,78,84,85,86,87,88,89,94,9,9,]),'postfix_expr':([0,2,11,19,22,23,25,26,27,28,29,30,31,34,61,68,69,70,71,72,73,81,83,95,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'primary_expr':([0,2,11,19,22,23,25,26,27,28,29,30,31,34,61,68,69,70,71,72,73,81,83,95,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'list_literal':([0,2,11,19,22,23,25,26,27,28,29,30,31,34,61,68,69,70,71,72,73,81,83,95,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'table_literal':([0,2,11,19,22,23,25,26,27,28,29,30,31,34,61,68,69,70,71,72,73,81,83,95,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'slice_list_opt':([14,],[35,]),'slice_list':([14,],[36,]),'slice':([14,36,],[37,56,]),'expression_list':([19,23,],[39,45,]),'arg_list':([23,],[44,]),'bool_expr':([31,34,],[52,55,]),'range_expr':([38,],[57,]),'table_params':([42,],[62,]),'table_param':([42,80,],[63,93,]),'block':([67,74,],[82,90,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> statement_list','program',1,'p_program','wizual_parser.py',12),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list_multiple','wizual_parser.py',16),
+  ('statement_list -> statement','statement_list',1,'p_statement_list_single','wizual_parser.py',20),
+  ('statement -> assignment_stmt','statement',1,'p_statement','wizual_parser.py',24),
+  ('statement -> void_function_call_stmt','statement',1,'p_statement','wizual_parser.py',25),
+  ('statement -> while_stmt','statement',1,'p_statement','wizual_parser.py',26),
+  ('statement -> if_stmt','statement',1,'p_statement','wizual_parser.py',27),
+  ('void_function_call_stmt -> expression SEMICOLON','void_function_call_stmt',2,'p_void_function_call_stmt','wizual_parser.py',31),
+  ('assignment_stmt -> IDENTIFIER ASSIGN expression SEMICOLON','assignment_stmt',4,'p_assignment_stmt','wizual_parser.py',35),
+  ('while_stmt -> WHILE LPAREN bool_expr RPAREN block','while_stmt',5,'p_while_stmt','wizual_parser.py',39),
+  ('if_stmt -> IF LPAREN bool_expr RPAREN block','if_stmt',5,'p_if_stmt','wizual_parser.py',43),
+  ('block -> LBRACE statement_list RBRACE','block',3,'p_block','wizual_parser.py',47),
+  ('bool_expr -> expression EQ expression','bool_expr',3,'p_bool_expr','wizual_parser.py',51),
+  ('bool_expr -> expression NE expression','bool_expr',3,'p_bool_expr','wizual_parser.py',52),
+  ('bool_expr -> expression LT expression','bool_expr',3,'p_bool_expr','wizual_parser.py',53),
+  ('bool_expr -> expression GT expression','bool_expr',3,'p_bool_expr','wizual_parser.py',54),
+  ('bool_expr -> expression LE expression','bool_expr',3,'p_bool_expr','wizual_parser.py',55),
+  ('bool_expr -> expression GE expression','bool_expr',3,'p_bool_expr','wizual_parser.py',56),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','wizual_parser.py',60),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','wizual_parser.py',61),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','wizual_parser.py',62),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','wizual_parser.py',63),
+  ('expression -> expression MOD expression','expression',3,'p_expression_binop','wizual_parser.py',64),
+  ('expression -> expression AT expression','expression',3,'p_expression_binop','wizual_parser.py',65),
+  ('expression -> postfix_expr','expression',1,'p_expression_postfix','wizual_parser.py',69),
+  ('postfix_expr -> primary_expr slice_list_opt','postfix_expr',2,'p_postfix_expr','wizual_parser.py',73),
+  ('slice_list_opt -> <empty>','slice_list_opt',0,'p_slice_list_opt_empty','wizual_parser.py',80),
+  ('slice_list_opt -> slice_list','slice_list_opt',1,'p_slice_list_opt_nonempty','wizual_parser.py',84),
+  ('slice_list -> slice','slice_list',1,'p_slice_list_single','wizual_parser.py',88),
+  ('slice_list -> slice_list slice','slice_list',2,'p_slice_list_multiple','wizual_parser.py',92),
+  ('slice -> LBRACKET range_expr RBRACKET','slice',3,'p_slice','wizual_parser.py',96),
+  ('range_expr -> NUMBER COLON NUMBER','range_expr',3,'p_range_expr_range','wizual_parser.py',100),
+  ('range_expr -> NUMBER','range_expr',1,'p_range_expr_single','wizual_parser.py',104),
+  ('range_expr -> STRING','range_expr',1,'p_range_expr_column','wizual_parser.py',108),
+  ('range_expr -> STRING COLON STRING','range_expr',3,'p_range_expr_columns','wizual_parser.py',112),
+  ('primary_expr -> IDENTIFIER LPAREN arg_list RPAREN','primary_expr',4,'p_primary_expr_func_call','wizual_parser.py',116),
+  ('primary_expr -> NUMBER','primary_expr',1,'p_primary_expr_number','wizual_parser.py',120),
+  ('primary_expr -> IDENTIFIER','primary_expr',1,'p_primary_expr_identifier','wizual_parser.py',124),
+  ('primary_expr -> STRING','primary_expr',1,'p_primary_expr_string','wizual_parser.py',128),
+  ('primary_expr -> LPAREN expression RPAREN','primary_expr',3,'p_primary_expr_paren','wizual_parser.py',132),
+  ('primary_expr -> list_literal','primary_expr',1,'p_primary_expr_list','wizual_parser.py',136),
+  ('primary_expr -> table_literal','primary_expr',1,'p_primary_expr_table','wizual_parser.py',140),
+  ('list_literal -> LBRACKET expression_list RBRACKET','list_literal',3,'p_list_literal_nonempty','wizual_parser.py',144),
+  ('list_literal -> LBRACKET RBRACKET','list_literal',2,'p_list_literal_empty','wizual_parser.py',148),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list_multiple','wizual_parser.py',152),
+  ('expression_list -> expression','expression_list',1,'p_expression_list_single','wizual_parser.py',156),
+  ('table_literal -> TABLE LPAREN table_params RPAREN','table_literal',4,'p_table_literal','wizual_parser.py',160),
+  ('table_params -> table_params COMMA table_param','table_params',3,'p_table_params_multiple','wizual_parser.py',164),
+  ('table_params -> table_param','table_params',1,'p_table_params_single','wizual_parser.py',170),
+  ('table_param -> IDENTIFIER ASSIGN expression','table_param',3,'p_table_param','wizual_parser.py',174),
+  ('arg_list -> <empty>','arg_list',0,'p_arg_list_empty','wizual_parser.py',178),
+  ('arg_list -> expression_list','arg_list',1,'p_arg_list_nonempty','wizual_parser.py',182),
+]
@@ -0,0 +1,101 @@
+from wizual_builtins import BUILTINS
+
+# Static types for the code generator. UNKNOWN means "could be anything" and
+# makes codegen fall back to the generic runtime helpers; _UNSET is the
+# fixpoint's starting point for variables whose assignments were not seen yet.
+
+NUMBER = 'number'
+STRING = 'string'
+LIST = 'list'
+TABLE = 'Table'
+UNKNOWN = None
+_UNSET = 'unset'
+
+def join(a, b):
+    if a == _UNSET:
+        return b
+    if b == _UNSET:
+        return a
+    return a if a == b else UNKNOWN
+
+def binop_type(op, lt, rt):
+    if _UNSET in (lt, rt):
+        return _UNSET
+    if op == '@':
+        return TABLE if lt == rt == TABLE else UNKNOWN
+    if UNKNOWN in (lt, rt):
+        return UNKNOWN
+    if LIST in (lt, rt):
+        return LIST
+    if TABLE in (lt, rt):
+        return TABLE if {lt, rt} <= {TABLE, NUMBER} else UNKNOWN
+    if lt == rt == NUMBER:
+        return NUMBER
+    if lt == rt == STRING and op == '+':
+        return STRING
+    return UNKNOWN
+
+def expr_type(node, env):
+    kind = node[0]
+    if kind == 'number':
+        return NUMBER
+    if kind == 'string':
+        return STRING
+    if kind == 'list':
+        return LIST
+    if kind == 'const':
+        return LIST if isinstance(node[1], list) else UNKNOWN
+    if kind == 'table':
+        return TABLE
+    if kind == 'var':
+        return env.get(node[1], _UNSET)
+    if kind == 'binop':
+        return binop_type(node[1], expr_type(node[2], env), expr_type(node[3], env))
+    if kind == 'slice':
+        base = expr_type(node[1], env)
+        if base == _UNSET:
+            return _UNSET
+        sl = node[2][0]
+        if base == LIST:
+            return LIST if sl == 'range' else UNKNOWN
+        if base == TABLE:
+            return TABLE if sl in ('range', 'columns') else LIST
+        return UNKNOWN
+    if kind == 'call':
+        if node[1] == 'readCSV' and len(node[2]) == 1:
+            return TABLE
+        builtin = BUILTINS.get(node[1])
+        return builtin.returns if builtin else UNKNOWN
+    return UNKNOWN
+
+def static_type(node, env):
+    if env is None:
+        return UNKNOWN
+    t = expr_type(node, env)
+    return UNKNOWN if t == _UNSET else t
+
+def _assignments(node, out):
+    kind = node[0]
+    if kind == 'assign':
+        out.append((node[1], node[2]))
+    elif kind in ('program', 'block'):
+        for stmt in node[1]:
+            _assignments(stmt, out)
+    elif kind in ('while', 'if'):
+        _assignments(node[2], out)
+    return out
+
+def infer_types(ast):
+    # Flow-insensitive: a variable gets one type for the whole program, the
+    # join of everything ever assigned to it, so loops and ifs stay sound.
+    assigns = _assignments(ast, [])
+    env = {}
+    changed = True
+    while changed:
+        changed = False
+        for name, expr in assigns:
+            t = join(env.get(name, _UNSET), expr_type(expr, env))
+            if env.get(name, _UNSET) != t:
+                env[name] = t
+                changed = True
+    return {name: (UNKNOWN if t == _UNSET else t) for name, t in env.items()}
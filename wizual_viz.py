@@ -1,63 +1,284 @@
-import matplotlib.pyplot as plt
+import atexit
+import os
+import threading
+import numpy as np
+
+# matplotlib is imported on the first chart that is actually drawn, not with
+# this module, so scripts (and inlined compiled scripts) that never reach a
+# plotting call do not pay for it; pyplot is only needed to show figures.
+
+# Rendering backends. With no render directory every chart is drawn on one
+# reused pyplot figure and shown. With a render directory (set_render_dir,
+# `wizuall.py --render-dir` or WIZUALL_RENDER_DIR) charts never block: each
+# call snapshots its inputs and queues a job that draws on a per-thread Agg
+# Figure and saves it as 0001_line_chart.png, ... while the script keeps
+# running. flush() waits for the queue and runs at exit.
+RENDER_FORMATS = ('png', 'svg')
+RENDER_THREADS = 4
+
+# Level of detail for big series (override per call with maxPoints): line
+# charts keep the min and max of each bucket, so peaks survive decimation;
+# scatter plots above the threshold become a 2D histogram of point density.
+LINE_MAX_POINTS = 4000
+SCATTER_MAX_POINTS = 50000
+SCATTER_BINS = 200
+
+# Heatmaps average blocks of cells down to at most HEATMAP_MAX_CELLS per
+# axis (about one cell per pixel) and label at most MAX_TICKS positions;
+# plotTable draws TABLE_VIEW_ROWS rows (head and tail, or one page) and
+# TABLE_VIEW_COLS columns, eliding the rest.
+HEATMAP_MAX_CELLS = 800
+MAX_TICKS = 20
+TABLE_VIEW_ROWS = 20
+TABLE_VIEW_COLS = 10
+ELLIPSIS = '\u2026'
+
+_render_dir = None
+_render_format = 'png'
+_render_pool = None
+_render_jobs = []
+_render_count = 0
+_render_local = threading.local()
+
+def set_render_dir(path, fmt='png'):
+    global _render_dir, _render_format
+    if fmt not in RENDER_FORMATS:
+        raise ValueError(f"Unknown render format '{fmt}' (expected 'png' or 'svg')")
+    if path:
+        os.makedirs(path, exist_ok=True)
+    _render_dir, _render_format = path or None, fmt
+
+def flush():
+    # wait for every queued figure; re-raises the first rendering error
+    jobs = _render_jobs[:]
+    del _render_jobs[:]
+    return [job.result() for job in jobs]
+
+def _render_job(draw, path, args):
+    fig = getattr(_render_local, 'fig', None)
+    if fig is None:
+        from matplotlib.figure import Figure
+        fig = _render_local.fig = Figure()
+    fig.clear()
+    draw(fig, fig.add_subplot(), *args)
+    fig.savefig(path)
+    return path
+
+def _render(name, draw, *args):
+    global _render_pool, _render_count
+    if _render_dir is None:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(num='WizuAll', clear=True)
+        draw(fig, fig.add_subplot(), *args)
+        plt.show()
+        return None
+    if _render_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _render_pool = ThreadPoolExecutor(min(RENDER_THREADS, os.cpu_count() or 1), 'wizuall-render')
+        atexit.register(flush)
+    _render_count += 1
+    path = os.path.join(_render_dir, f"{_render_count:04d}_{name}.{_render_format}")
+    _render_jobs.append(_render_pool.submit(_render_job, draw, path, args))
+    return None
+
+def _bins(n, limit):
+    # (run length k, number of bins) that fold n cells into at most limit
+    k = -(-n // limit)
+    return k, -(-n // k)
+
+def _bin_sums(col, k, b):
+    # per-bin sums and counts of the non-NaN cells of one column
+    padded = np.full(b * k, np.nan)
+    padded[:len(col)] = col
+    padded = padded.reshape(b, k)
+    return np.nansum(padded, axis=1), np.count_nonzero(~np.isnan(padded), axis=1)
+
+def _thin_ticks(n, labels):
+    step = -(-n // MAX_TICKS) if n else 1
+    ticks = list(range(0, n, step))
+    return ticks, [labels[i] for i in ticks]
+
+def _draw_heatmap(fig, ax, grid, rows, headers):
+    cols = len(headers)
+    cax = ax.imshow(grid, aspect='auto', interpolation='nearest',
+                    extent=(-0.5, cols - 0.5, rows - 0.5, -0.5))
+    ticks, labels = _thin_ticks(cols, headers)
+    ax.set_xticks(ticks)
+    if len(ticks) > 8:
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+    else:
+        ax.set_xticklabels(labels)
+    ticks, labels = _thin_ticks(rows, range(rows))
+    ax.set_yticks(ticks)
+    ax.set_yticklabels(labels)
+    fig.colorbar(cax, ax=ax)
+    ax.set_title("Table heatmap")
 
 def plot_table_heatmap(table):
-    data = table.data
-    fig, ax = plt.subplots()
-    cax = ax.imshow(data, aspect='auto', interpolation='nearest')
-    ax.set_xticks(range(table.cols))
-    ax.set_xticklabels(table.headers)
-    ax.set_yticks(range(table.rows))
-    ax.set_yticklabels(range(table.rows))
-    plt.colorbar(cax, ax=ax)
-    plt.title("Table heatmap")
-    plt.show()
+    # each column is read once and averaged into at most HEATMAP_MAX_CELLS
+    # row bins straight away, so the float grid that is queued is never
+    # bigger than the pixel budget, whatever the table size
+    if not table.rows or not table.cols:
+        return None
+    kr, br = _bins(table.rows, HEATMAP_MAX_CELLS)
+    kc, bc = _bins(table.cols, HEATMAP_MAX_CELLS)
+    sums, counts = np.zeros((br, bc)), np.zeros((br, bc))
+    for j in range(table.cols):
+        s, c = _bin_sums(np.asarray(table.get_col(j), dtype=float), kr, br)
+        sums[:, j // kc] += s
+        counts[:, j // kc] += c
+    with np.errstate(invalid='ignore'):
+        grid = sums / counts
+    _render('heatmap', _draw_heatmap, grid, table.rows, [str(h) for h in table.headers])
 
-def bar_chart(labels, values, title=None):
-    fig, ax = plt.subplots()
+def _draw_bar(fig, ax, labels, values, title):
     ax.bar(labels, values)
     if title: ax.set_title(title)
-    plt.show()
 
-def line_chart(x, y, title=None):
-    fig, ax = plt.subplots()
-    ax.plot(x, y, marker='o')
+def bar_chart(labels, values, title=None):
+    _render('bar_chart', _draw_bar, list(labels), list(values), title)
+
+def _floats(values):
+    try:
+        out = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    return out if out.ndim == 1 else None
+
+def _decimate(y, max_points):
+    # indices of the first and last point plus the min and max of each of
+    # max_points/2 equal buckets, in order
+    n = len(y)
+    k = -(-n // max(1, max_points // 2))
+    b = -(-n // k)
+    grid = np.full(b * k, np.nan)
+    grid[:n] = y
+    grid = grid.reshape(b, k)
+    pairs = np.sort(np.stack((np.nanargmin(grid, axis=1), np.nanargmax(grid, axis=1)), axis=1), axis=1)
+    idx = (pairs + (np.arange(b) * k)[:, None]).ravel()
+    return np.unique(np.concatenate(([0], idx, [n - 1])))
+
+def _draw_line(fig, ax, x, y, title, marker='o'):
+    ax.plot(x, y, marker=marker)
     if title: ax.set_title(title)
     ax.set_xlabel("x")
     ax.set_ylabel("y")
-    plt.show()
 
-def scatter_plot(x, y, title=None):
-    fig, ax = plt.subplots()
+def line_chart(x, y, title=None, max_points=None):
+    max_points = int(max_points or LINE_MAX_POINTS)
+    ys = _floats(y) if len(y) > max_points else None
+    if ys is not None and len(x) == len(ys):
+        # missing cells (NaN, e.g. from readCSV) are dropped, not plotted
+        keep = np.flatnonzero(np.isfinite(ys))
+        idx = keep[_decimate(ys[keep], max_points)] if len(keep) else keep
+        xs = _floats(x)
+        x = xs[idx] if xs is not None else [x[i] for i in idx.tolist()]
+        _render('line_chart', _draw_line, x, ys[idx], title, None)
+        return
+    _render('line_chart', _draw_line, list(x), list(y), title)
+
+def _draw_scatter(fig, ax, x, y, title):
     ax.scatter(x, y)
     if title: ax.set_title(title)
-    plt.show()
 
-def histogram(data, bins=10, title=None):
-    fig, ax = plt.subplots()
+def _draw_density(fig, ax, counts, x_edges, y_edges, title):
+    from matplotlib.colors import LogNorm
+    mesh = ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), norm=LogNorm())
+    fig.colorbar(mesh, ax=ax, label="points")
+    if title: ax.set_title(title)
+
+def scatter_plot(x, y, title=None, max_points=None):
+    max_points = int(max_points or SCATTER_MAX_POINTS)
+    if len(x) > max_points and len(x) == len(y):
+        xs, ys = _floats(x), _floats(y)
+        if xs is not None and ys is not None:
+            ok = np.isfinite(xs) & np.isfinite(ys)
+            counts, x_edges, y_edges = np.histogram2d(xs[ok], ys[ok], bins=SCATTER_BINS)
+            _render('scatter_plot', _draw_density, counts, x_edges, y_edges, title)
+            return
+    _render('scatter_plot', _draw_scatter, list(x), list(y), title)
+
+def _draw_histogram(fig, ax, data, bins, title):
     ax.hist(data, bins=bins)
     if title: ax.set_title(title)
-    plt.show()
 
-def plot_table(table_val):
-    fig, ax = plt.subplots()
+def histogram(data, bins=10, title=None):
+    _render('histogram', _draw_histogram, list(data), bins, title)
+
+def _draw_table(fig, ax, rows, headers, title):
     ax.axis('off')
-    tbl = ax.table(cellText=table_val.data, colLabels=table_val.headers, loc="center")
+    tbl = ax.table(cellText=rows, colLabels=headers, loc="center")
     tbl.auto_set_font_size(False)
-    tbl.scale(1, 1.5)
-    plt.title("Table View")
-    plt.show()
+    if len(rows) > 10:
+        tbl.set_fontsize(7)
+    tbl.scale(1, 1.5 if len(rows) <= 10 else 1)
+    ax.set_title(title)
+
+def _cell_text(v):
+    return f"{v:.4g}" if isinstance(v, float) else str(v)
+
+def _elide(values, keep):
+    values = list(values)
+    if len(values) <= keep:
+        return values
+    return values[:keep - keep // 2] + [ELLIPSIS] + values[len(values) - keep // 2:]
 
-def line_chart_table(table):
-    labels = [str(h) for h in table.headers]
+def plot_table(table_val, page=None):
+    # only the cells that are drawn are read: head and tail rows with an
+    # elision row, or rows [page*TABLE_VIEW_ROWS, ...) when a page is given
+    n = table_val.rows
+    if page is not None:
+        start = int(page) * TABLE_VIEW_ROWS
+        if not 0 <= start < max(n, 1):
+            raise IndexError(f"Table page {page} out of range")
+        picked = list(range(start, min(start + TABLE_VIEW_ROWS, n)))
+    else:
+        picked = _elide(range(n), TABLE_VIEW_ROWS)
+    rows = [[ELLIPSIS] * min(table_val.cols, TABLE_VIEW_COLS + 1) if i == ELLIPSIS
+            else _elide(map(_cell_text, table_val.get_row(i)), TABLE_VIEW_COLS) for i in picked]
+    title = "Table View"
+    if page is not None:
+        title += f" (rows {picked[0]}-{picked[-1]} of {n})" if picked else ""
+    elif n > TABLE_VIEW_ROWS or table_val.cols > TABLE_VIEW_COLS:
+        title += f" ({n} x {table_val.cols})"
+    _render('table', _draw_table, rows, _elide(table_val.headers, TABLE_VIEW_COLS), title)
+
+def _draw_line_table(fig, ax, rows, headers):
+    labels = [str(h) for h in headers]
     x = list(range(len(labels)))
-    fig, ax = plt.subplots()
-    for idx, row in enumerate(table.data, start=1):
+    for idx, row in enumerate(rows, start=1):
         ax.plot(x, row, marker='o', label=f"Series {idx}")
     ax.set_xticks(x)
     ax.set_xticklabels(labels, rotation=45, ha='right')
     ax.set_xlabel("Header")
     ax.set_ylabel("Value")
-    plt.title("All Series")
+    ax.set_title("All Series")
     ax.legend()
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    fig.tight_layout()
+
+def _draw_band(fig, ax, low, high, mean, headers, series):
+    labels = [str(h) for h in headers]
+    x = np.arange(len(labels))
+    ax.fill_between(x, low, high, alpha=0.3, label=f"Min-max of {series} series")
+    ax.plot(x, mean, label="Mean")
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=45, ha='right')
+    ax.set_xlabel("Header")
+    ax.set_ylabel("Value")
+    ax.set_title("All Series")
+    ax.legend()
+    fig.tight_layout()
+
+def line_chart_table(table, max_points=None):
+    # one line per row; past max_points cells the rows are summarised as the
+    # per-column min-max envelope and mean, which keeps every extreme visible
+    max_points = int(max_points or LINE_MAX_POINTS)
+    if table.rows > 1 and table.rows * table.cols > max_points:
+        cols = [_floats(table.get_col(j)) for j in range(table.cols)]
+        if all(c is not None for c in cols):
+            _render('line_chart_table', _draw_band, [np.nanmin(c) for c in cols], [np.nanmax(c) for c in cols],
+                    [np.nanmean(c) for c in cols], list(table.headers), table.rows)
+            return
+    _render('line_chart_table', _draw_line_table, list(table.data), list(table.headers))
+
+set_render_dir(os.environ.get('WIZUALL_RENDER_DIR'), os.environ.get('WIZUALL_RENDER_FORMAT', 'png'))
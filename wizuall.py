@@ -1,18 +1,19 @@
 import argparse
+import os
 import sys
-from wizual_interpreter import run, EvalError
+from pprint import pprint
+from wizual_interpreter import Session, EvalError
 from wizual_lexer import LexError
-from wizual_parser import parser as ply_parser
+from wizual_cache import load_ast, default_cache_dir, CACHE_MAX_BYTES
 from wizual_codegen import generate_py
-
-
-def execute_all(buffered_stmts):
-    code = "".join(buffered_stmts)
-    return run(code)
+from wizual_optimizer import optimize
+from wizual_builtins import load_plugins
+from wizual_helper import set_workers
 
 
 def repl():
     print("Welcome to WizuAll REPL. Type your statements ending with ';'. Ctrl-D to exit.")
+    session = Session()
     buffered = []
     while True:
         try:
@@ -26,8 +27,9 @@ def repl():
         if not line.strip().endswith(';'):
             continue
         try:
-            execute_all(buffered)
-        except (LexError, SyntaxError, EvalError, NameError, TypeError, ValueError) as e:
+            session.execute("".join(buffered))
+        except (LexError, SyntaxError, EvalError, NameError, TypeError, ValueError,
+                IndexError, ZeroDivisionError, OSError) as e:
             print("Error:", e)
         buffered.clear()
     print("Goodbye!")
@@ -37,31 +39,66 @@ def main():
     parser = argparse.ArgumentParser(prog="wizuall")
     parser.add_argument('file', nargs='?', help="WizuAll source file to execute", default='example.viz')
     parser.add_argument('--compile', '-c', metavar='OUT.py', help="Generate a Python script from the WizuAll source", default='output.py')
+    parser.add_argument('--plugin', action='append', default=[], metavar='MODULE',
+                        help="Import MODULE to register extra builtins (repeatable; also read from WIZUALL_PLUGINS)")
+    parser.add_argument('--runtime', choices=('inline', 'package'), default='inline',
+                        help="inline: paste the runtime into the generated script; package: import it from wizuall_runtime")
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help="Where parsed scripts are cached (default: __vizcache__ next to the script, or WIZUALL_CACHE_DIR)")
+    parser.add_argument('--cache-max-bytes', type=int, default=CACHE_MAX_BYTES, metavar='N',
+                        help="Evict least recently used cache entries beyond N bytes")
+    parser.add_argument('--no-cache', action='store_true', help="Always re-parse the source")
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help="Split large table operations across N processes (also read from WIZUALL_WORKERS)")
+    parser.add_argument('--render-dir', metavar='DIR',
+                        help="Save charts to DIR in the background instead of showing them (also read from WIZUALL_RENDER_DIR)")
+    parser.add_argument('--render-format', choices=('png', 'svg'), default='png', help="File format for --render-dir")
+    parser.add_argument('--dump-ast', action='store_true',
+                        help="Print the optimized AST and what the optimizer folded, then exit")
+    parser.add_argument('--repl', '-i', action='store_true', help="Start an interactive session instead of running a file")
     args = parser.parse_args()
-    if args.file:
+    load_plugins(os.environ.get('WIZUALL_PLUGINS', '').split(',') + args.plugin)
+    if args.render_dir:
+        # read by wizual_viz when the first chart builtin imports it
+        os.environ['WIZUALL_RENDER_DIR'] = args.render_dir
+        os.environ['WIZUALL_RENDER_FORMAT'] = args.render_format
+    if args.file and not args.repl:
         try:
             with open(args.file) as f:
                 code = f.read()
         except FileNotFoundError:
             print(f"Error: file '{args.file}' not found.")
             sys.exit(1)
-        if args.compile:
+        cache_dir = None if args.no_cache else (args.cache_dir or default_cache_dir(args.file))
+        if args.dump_ast:
+            try:
+                stats = {}
+                pprint(optimize(load_ast(code, cache_dir, args.cache_max_bytes), stats), width=100)
+                print(f"# folded {stats['folded']} constant expressions, pruned {stats['pruned']} branches")
+            except (LexError, SyntaxError) as e:
+                print("Error:", e)
+                sys.exit(1)
+        elif args.compile:
             try:
-                ast = ply_parser.parse(code)
-                generate_py(ast, args.compile)
+                ast = load_ast(code, cache_dir, args.cache_max_bytes)
+                generate_py(ast, args.compile, args.runtime, args.workers, args.render_dir, args.render_format)
                 print(f"Generated {args.compile}")
             except Exception as e:
                 print("Error during compilation:", e)
                 sys.exit(1)
         else:
             try:
-                sym = run(code)
+                set_workers(args.workers or os.environ.get('WIZUALL_WORKERS'))
+                sym = Session().execute_ast(load_ast(code, cache_dir, args.cache_max_bytes))
+                if 'wizual_viz' in sys.modules:
+                    sys.modules['wizual_viz'].flush()
                 print("Symbol Table:")
                 print(sym)
             except (LexError, SyntaxError, EvalError, NameError, TypeError, ValueError) as e:
                 print("Error:", e)
                 sys.exit(1)
     else:
+        set_workers(args.workers or os.environ.get('WIZUALL_WORKERS'))
         repl()
 
 
@@ -0,0 +1,56 @@
+# Runtime imported by scripts generated with `wizuall.py --runtime package`.
+# Generated code imports only the names it uses from here; plotting goes
+# through wrappers that load wizual_viz (and matplotlib) on first call.
+from wizual_helper import (Table, SEQUENCE_TYPES, matmul, read_csv, read_csv_builtin, read_table,
+                           write_table, set_workers)
+
+# -- helpers: pasted verbatim into standalone (--runtime inline) scripts --
+import operator as _operator
+from itertools import repeat as _repeat
+
+_OPS = {'+': _operator.add, '-': _operator.sub, '*': _operator.mul,
+        '/': _operator.truediv, '%': _operator.mod}
+
+def _binop(op, a, b):
+    fn = _OPS[op]
+    if isinstance(a, SEQUENCE_TYPES):
+        if isinstance(b, SEQUENCE_TYPES):
+            return [fn(x, y) for x, y in zip(a, b)]
+        return [fn(x, b) for x in a]
+    if isinstance(b, SEQUENCE_TYPES):
+        return [fn(a, y) for y in b]
+    return fn(a, b)
+
+def _index(base, i):
+    if isinstance(base, Table):
+        return base.get_row(i)
+    return base[i]
+
+def _range(base, start, end):
+    if isinstance(base, Table):
+        return base.slice_rows(start, end)
+    return base[start:end]
+
+def _avg(xs):
+    return sum(xs) / len(xs)
+
+def _plugin(module, name):
+    __import__(module)
+    return __import__('wizual_builtins').BUILTINS[name]
+# -- end helpers --
+
+VIZ_FUNCTIONS = ('plot_table_heatmap', 'bar_chart', 'line_chart', 'scatter_plot',
+                 'histogram', 'plot_table', 'line_chart_table', 'set_render_dir', 'flush')
+
+def _lazy_viz(name):
+    def call(*args, **kwargs):
+        import wizual_viz
+        return getattr(wizual_viz, name)(*args, **kwargs)
+    call.__name__ = name
+    return call
+
+for _name in VIZ_FUNCTIONS:
+    globals()[_name] = _lazy_viz(_name)
+
+EXPORTS = ('Table', 'matmul', 'read_csv', 'read_csv_builtin', 'read_table', 'write_table',
+           'set_workers', '_repeat', '_binop', '_index', '_range', '_avg', '_plugin') + VIZ_FUNCTIONS